@@ -0,0 +1,155 @@
+import math
+from anime_parser import parse_release, SEASON_PATTERN
+from anime_matcher import normalize_series, SEGMENT
+
+NGRAM_SIZE = 3
+MIN_CONFIDENCE = 0.6
+SEASON_MISMATCH_PENALTY = 0.75
+LOOKUP_CACHE_SIZE = 8192
+# Earlier sources win when two of them claim the same alias
+SOURCE_PRIORITY = ("tracked", "metadata", "schedule")
+
+
+def split_alias(text):
+    """Return (base key, season) for a series name or release title.
+
+    The season suffix ("S2", "Season 2", "2nd Season") is split off so
+    "Tower of God S2" and "Tower of God Season 2" share a base key and season.
+    """
+    series = parse_release(text).series
+    season = None
+    season_match = SEASON_PATTERN.search(series)
+    if season_match:
+        season = int(season_match.group("short") or season_match.group("long")
+                      or season_match.group("ordinal"))
+        series = series[:season_match.start()]
+    base = normalize_series(series).replace(f" {SEGMENT} ", " ")
+    return base, season if season != 1 else None
+
+
+def numbers(base):
+    return frozenset(token for token in base.split() if token.isdigit())
+
+
+def ngrams(text, size=NGRAM_SIZE):
+    padded = f" {text} "
+    return frozenset(padded[index:index + size] for index in range(len(padded) - size + 1))
+
+
+class AliasMatch:
+    __slots__ = ("name", "confidence", "source", "alias")
+
+    def __init__(self, name, confidence, source, alias):
+        self.name = name
+        self.confidence = confidence
+        self.source = source
+        self.alias = alias
+
+    def __repr__(self):
+        return f"AliasMatch({self.name!r}, {self.confidence:.2f}, {self.source!r})"
+
+
+class AliasIndex:
+    """Fuzzy index from known aliases to canonical series names.
+
+    Every alias is reduced to a base key plus season and indexed by its
+    character trigrams. `lookup` answers exact base/season hits with
+    confidence 1.0 and anything else by the Dice coefficient of the trigram sets
+    shared with the closest alias. A different season, or different numbers
+    in the name ("Blue Lock" vs "Blue Lock 2"), lowers the confidence.
+    """
+    def __init__(self):
+        self.aliases = []        # (base, season, grams, size, name, source, numbers)
+        self.exact = {}          # base -> alias ids
+        self.grams = {}          # trigram -> alias ids
+        self.lookup_cache = {}
+
+    def __len__(self):
+        return len(self.aliases)
+
+    def add(self, name, aliases=(), source="tracked"):
+        """Index `name` and its `aliases` as spellings of the series `name`."""
+        seen = set()
+        for alias in (name, *aliases):
+            if not alias:
+                continue
+            base, season = split_alias(alias)
+            if not base or (base, season) in seen:
+                continue
+            seen.add((base, season))
+            grams = ngrams(base)
+            alias_id = len(self.aliases)
+            self.aliases.append((base, season, grams, len(grams), name, source, numbers(base)))
+            self.exact.setdefault(base, []).append(alias_id)
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(alias_id)
+        self.lookup_cache.clear()
+
+    def _rank(self, alias_id):
+        source = self.aliases[alias_id][5]
+        return SOURCE_PRIORITY.index(source) if source in SOURCE_PRIORITY else len(SOURCE_PRIORITY)
+
+    def exact_candidates(self, base, season):
+        """Yield (confidence, alias id) for aliases with exactly this base key."""
+        for alias_id in self.exact.get(base, ()):
+            yield (1.0 if self.aliases[alias_id][1] == season else SEASON_MISMATCH_PENALTY), alias_id
+
+    def fuzzy_candidates(self, base, season):
+        """Yield (confidence, alias id) for aliases that may reach MIN_CONFIDENCE."""
+        grams = ngrams(base)
+        size = len(grams)
+        title_numbers = numbers(base)
+        # An alias with a Dice score of at least MIN_CONFIDENCE shares at least
+        # `needed` trigrams with the title, so it must contain one of the
+        # size - needed + 1 rarest ones; only those posting lists are read.
+        needed = max(1, math.ceil(MIN_CONFIDENCE * size / (2 - MIN_CONFIDENCE)))
+        rarest = sorted(grams, key=lambda gram: len(self.grams.get(gram, ())))[:size - needed + 1]
+        candidates = set()
+        for gram in rarest:
+            candidates.update(self.grams.get(gram, ()))
+        for alias_id in candidates:
+            _, alias_season, alias_grams, alias_size, _, _, alias_numbers = self.aliases[alias_id]
+            if 2 * min(size, alias_size) < MIN_CONFIDENCE * (size + alias_size):
+                continue
+            confidence = 2 * len(grams & alias_grams) / (size + alias_size)
+            if alias_season != season or alias_numbers != title_numbers:
+                confidence *= SEASON_MISMATCH_PENALTY
+            yield confidence, alias_id
+
+    def best_match(self, candidates, sources):
+        best = None
+        best_key = None
+        for confidence, alias_id in candidates:
+            if sources is not None and self.aliases[alias_id][5] not in sources:
+                continue
+            if best_key is not None and confidence < best_key[0]:
+                continue
+            key = (confidence, -self._rank(alias_id))
+            if best_key is None or key > best_key:
+                best_key = key
+                base, _, _, _, name, source, _ = self.aliases[alias_id]
+                best = AliasMatch(name, confidence, source, base)
+        return best
+
+    def lookup(self, title, min_confidence=MIN_CONFIDENCE, sources=None):
+        """Return the best AliasMatch for `title`, or None below `min_confidence`.
+
+        `sources` optionally restricts the answer to aliases added from those
+        sources. An exact base key hit skips the trigram search.
+        """
+        cache_key = (title, sources)
+        if cache_key in self.lookup_cache:
+            best = self.lookup_cache[cache_key]
+        else:
+            best = None
+            base, season = split_alias(title)
+            if base:
+                best = self.best_match(self.exact_candidates(base, season), sources)
+                if best is None:
+                    best = self.best_match(self.fuzzy_candidates(base, season), sources)
+            if len(self.lookup_cache) >= LOOKUP_CACHE_SIZE:
+                self.lookup_cache.clear()
+            self.lookup_cache[cache_key] = best
+        if best is None or best.confidence < min_confidence:
+            return None
+        return best
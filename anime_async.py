@@ -0,0 +1,164 @@
+import json
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import aiohttp
+
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+TOTAL_CONNECTIONS = 100
+PER_HOST_CONNECTIONS = 6
+# Hosts that need a tighter limit than PER_HOST_CONNECTIONS
+HOST_LIMITS = {"api.jikan.moe": 3}
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff for the given retry attempt."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def retry_after_delay(headers):
+    """Seconds a Retry-After header asks us to wait, or None."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0), BACKOFF_MAX)
+
+
+class AsyncResponse:
+    """A fully read response, usable after the connection went back to the pool."""
+    __slots__ = ("url", "status_code", "headers", "content")
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise aiohttp.ClientResponseError(
+                None, (), status=self.status_code, message=f"HTTP {self.status_code} for {self.url}"
+            )
+
+
+class AsyncEngine:
+    """One asyncio event loop, on one daemon thread, for outgoing HTTP.
+
+    Requests share an aiohttp connection pool limited to `total_limit`
+    connections and `per_host_limit` per host (HOST_LIMITS can lower that for
+    single hosts). Coroutines are handed in from any thread with `submit`,
+    which returns a concurrent.futures.Future, or `run`, which blocks for the
+    result; the loop itself must never call `run`.
+    """
+    def __init__(self, retries=3, connect_timeout=5, read_timeout=20,
+                 total_limit=TOTAL_CONNECTIONS, per_host_limit=PER_HOST_CONNECTIONS):
+        self.retries = retries
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_limit = total_limit
+        self.per_host_limit = per_host_limit
+        self.lock = threading.Lock()
+        self.loop = None
+        self.thread = None
+        self.session = None
+        self.host_semaphores = {}
+
+    def start(self):
+        with self.lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self.thread = threading.Thread(target=self._run, name="AsyncEngine", daemon=True)
+                self.thread.start()
+        return self.loop
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule a coroutine on the engine loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the engine loop and wait for its result."""
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("AsyncEngine.run called from the engine loop; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.total_limit, limit_per_host=self.per_host_limit,
+                                               ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(connect=self.connect_timeout, sock_read=self.read_timeout),
+                headers={"User-Agent": "ANICHAIN", "Accept-Encoding": "gzip, deflate"}
+            )
+        return self.session
+
+    def get_host_semaphore(self, url):
+        host = urlsplit(url).hostname
+        if host not in HOST_LIMITS:
+            return None
+        semaphore = self.host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self.host_semaphores[host] = asyncio.Semaphore(HOST_LIMITS[host])
+        return semaphore
+
+    async def fetch(self, url, **kwargs):
+        async with self.get_session().get(url, **kwargs) as response:
+            return AsyncResponse(str(response.url), response.status, response.headers, await response.read())
+
+    async def get(self, url, limiter=None, priority=None, **kwargs):
+        """GET a URL with retries, returning an AsyncResponse.
+
+        Connection errors, timeouts and 429/5xx answers are retried with
+        jittered exponential backoff or after the server's Retry-After.
+        `limiter.wait_async(priority)` is awaited before every attempt.
+        """
+        semaphore = self.get_host_semaphore(url)
+        for attempt in range(self.retries + 1):
+            if limiter:
+                await (limiter.wait_async() if priority is None else limiter.wait_async(priority))
+            try:
+                if semaphore:
+                    async with semaphore:
+                        response = await self.fetch(url, **kwargs)
+                else:
+                    response = await self.fetch(url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"Request to {url} failed ({e!r}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    return response
+                delay = retry_after_delay(response.headers)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                print(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Close the connection pool and stop the loop."""
+        if self.loop is None:
+            return
+        if self.session is not None:
+            self.submit(self.session.close()).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
@@ -2,42 +2,324 @@ import os
 import json
 import time
 import queue
+import re
+import hashlib
+import urllib.parse
+import heapq
+import asyncio
+import itertools
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 import feedparser
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future
 from qbittorrentapi import Client
+from anime_store import FeedHistory, TrackedStore, DownloadGuard, SeriesAliases, MetadataCache, MissCache
+from anime_aliases import AliasIndex
+from anime_rules import RuleEngine
+from anime_async import AsyncEngine, RETRY_STATUSES, backoff_delay, retry_after_delay
+from anime_queue import TorrentQueue
+from anime_parser import parse_release
+from anime_matcher import SeriesMatcher
+from anime_scheduler import PollScheduler, get_air_times
+from anime_feed import ParsedFeed, iter_feed_entries, iter_file_chunks, CHUNK_SIZE
 
 SETTINGS_FILE = "settings.txt"
 TRACKED_FILE = "tracked_anime.txt"
 PLACEHOLDER_IMAGE = "placeholder.jpg"
 CACHE_DIR = "image_cache"
+FEED_STATE_FILE = "feed_state.json"
+FEED_CACHE_DIR = "feed_cache"
+HISTORY_DB = "anichain.db"
 MAX_RETRIES = 3
-JIKAN_RATE_LIMIT = 1
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 20
+HTTP_POOL_SIZE = 10
+JIKAN_RATE_LIMIT = 3
+JIKAN_MINUTE_LIMIT = 60
+# Rate limiter priorities, lower is served first
+PRIORITY_USER = 0
+PRIORITY_VISIBLE = 1
+PRIORITY_BACKGROUND = 2
+SCHEDULE_TTL = 300
+FEED_WORKERS = 4
+BACKFILL_URL = "https://nyaa.si/?page=rss&u=subsplease&q={query}&p={page}"
+BACKFILL_PAGES = 3
+TRACKED_ALIAS_CONFIDENCE = 0.8
+# How long each cached Jikan field stays fresh, in seconds
+METADATA_TTLS = {
+    "mal_id": 30 * 86400,
+    "title": 30 * 86400,
+    "synopsis": 30 * 86400,
+    "image_url": 30 * 86400,
+    "genres": 30 * 86400,
+    "episodes": 86400,
+    "status": 86400
+}
+# How long a lookup that found nothing is remembered before it is tried again
+NEGATIVE_CACHE_TTL = 86400
+
+# add_torrent results
+TORRENT_ADDED = "added"
+TORRENT_DUPLICATE = "skipped duplicate"
+TORRENT_FAILED = "failed"
 
 # Create cache directory if it doesn't exist
 os.makedirs(CACHE_DIR, exist_ok=True)
+os.makedirs(FEED_CACHE_DIR, exist_ok=True)
 
 class RateLimiter:
-    def __init__(self, calls_per_second=1):
-        self.calls_per_second = calls_per_second
-        self.last_call = 0
+    """Token buckets for a per-second and a per-minute limit.
+
+    A call needs a token from both buckets. Waiters are coroutines on one
+    event loop, served by priority (lower first, e.g. PRIORITY_USER before
+    PRIORITY_BACKGROUND) and then in arrival order. Only the waiter at the
+    front of the queue sleeps until the buckets refill; the others wait on a
+    future that is resolved when they reach the front. A FlightPriority
+    can be passed instead of a number; raising it moves the waiter up.
+    """
+    def __init__(self, per_second=JIKAN_RATE_LIMIT, per_minute=JIKAN_MINUTE_LIMIT):
+        # [capacity, refill per second, tokens]
+        self.buckets = [[per_second, per_second, per_second], [per_minute, per_minute / 60, per_minute]]
+        self.updated = time.monotonic()
+        self.waiters = []
+        self.wakeups = {}        # ticket -> future of a waiter not at the front
+        self.counter = itertools.count()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        for bucket in self.buckets:
+            bucket[2] = min(bucket[0], bucket[2] + elapsed * bucket[1])
+
+    def _delay(self):
+        """Seconds until both buckets hold a token (0 if they do now)."""
+        return max(max(0, (1 - tokens) / rate) for _, rate, tokens in self.buckets)
+
+    def _wake_front(self):
+        if self.waiters:
+            future = self.wakeups.pop(self.waiters[0], None)
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    async def wait_async(self, priority=PRIORITY_VISIBLE):
+        """Wait for a token without blocking the event loop."""
+        flight = priority if isinstance(priority, FlightPriority) else None
+        ticket = (flight.value if flight else priority, next(self.counter))
+        heapq.heappush(self.waiters, ticket)
+
+        def requeue():
+            nonlocal ticket
+            if ticket is None or flight.value >= ticket[0]:
+                return
+            future = self.wakeups.pop(ticket, None)
+            self.waiters.remove(ticket)
+            heapq.heapify(self.waiters)
+            ticket = (flight.value, ticket[1])
+            heapq.heappush(self.waiters, ticket)
+            # Let the waiter check its new place in line
+            if future is not None and not future.done():
+                future.set_result(None)
+
+        if flight:
+            flight.listeners.append(requeue)
+        try:
+            while True:
+                if self.waiters[0] != ticket:
+                    future = self.wakeups[ticket] = asyncio.get_running_loop().create_future()
+                    await future
+                    continue
+                self._refill()
+                delay = self._delay()
+                if delay <= 0:
+                    for bucket in self.buckets:
+                        bucket[2] -= 1
+                    heapq.heappop(self.waiters)
+                    ticket = None
+                    self._wake_front()
+                    return
+                await asyncio.sleep(delay)
+        finally:
+            if flight:
+                flight.listeners.remove(requeue)
+            if ticket is not None:
+                # Cancelled while queued: give up the place in line
+                self.wakeups.pop(ticket, None)
+                at_front = self.waiters[0] == ticket
+                self.waiters.remove(ticket)
+                heapq.heapify(self.waiters)
+                if at_front:
+                    self._wake_front()
+
+class HttpClient:
+    """Shared HTTP layer for every outgoing request.
+
+    One requests.Session with a keep-alive connection pool per host (the
+    session is shared between threads; only idempotent GETs go through it),
+    gzip/deflate bodies, and (connect, read) timeouts on every call.
+    Connection errors, timeouts and 429/5xx answers are retried up to
+    `retries` times with exponentially growing, fully jittered delays, or
+    after the server's Retry-After when it sends one.
+    """
+    def __init__(self, retries=MAX_RETRIES, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), pool_size=HTTP_POOL_SIZE):
+        self.retries = retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": "ANICHAIN"})
+        self.closed = threading.Event()
+
+    def get(self, url, **kwargs):
+        """GET with retries."""
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(self.retries + 1):
+            if self.closed.is_set():
+                raise requests.ConnectionError("HTTP client closed")
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retries:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    return response
+                delay = retry_after_delay(response.headers)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                response.close()
+                print(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            self.closed.wait(delay)
+
+    def close(self):
+        """Stop retrying and close the pooled connections.
+
+        A request already in progress still ends within its timeout; pending
+        retries and backoff sleeps end immediately with a ConnectionError.
+        """
+        self.closed.set()
+        self.session.close()
+
+class FlightPriority:
+    """Limiter priority of a shared fetch, raised when a more urgent caller joins."""
+    def __init__(self, value):
+        self.value = value
+        self.listeners = []
+
+    def raise_to(self, priority):
+        """Raise to `priority` (a number or another FlightPriority, followed from now on)."""
+        value = priority
+        if isinstance(priority, FlightPriority):
+            priority.listeners.append(lambda: self.raise_to(priority.value))
+            value = priority.value
+        if value < self.value:
+            self.value = value
+            for listener in list(self.listeners):
+                listener()
+
+class SingleFlight:
+    """Run at most one call per key at a time.
+
+    Callers asking for a key that is already being fetched wait for that
+    call and get its result (or exception) instead of starting their own.
+    The calls saved this way are counted in `suppressed`. With a `priority`
+    the call gets a FlightPriority as its last argument, and a joiner with a
+    more urgent priority raises it, so a click is not stuck behind the
+    background fetch it joined.
+    """
+    def __init__(self):
         self.lock = threading.Lock()
+        self.tasks = {}
+        self.suppressed = 0
 
-    def wait(self):
+    async def do_async(self, key, func, *args, priority=None):
+        """Await `func(*args)`, sharing one task per key on the running loop."""
         with self.lock:
-            current_time = time.time()
-            time_since_last_call = current_time - self.last_call
-            if time_since_last_call < 1.0 / self.calls_per_second:
-                time.sleep(1.0 / self.calls_per_second - time_since_last_call)
-            self.last_call = time.time()
+            flight = self.tasks.get(key)
+            if flight is None:
+                flight_priority = None
+                if priority is not None:
+                    flight_priority = FlightPriority(PRIORITY_BACKGROUND + 1)
+                    args += (flight_priority,)
+                task = asyncio.ensure_future(func(*args))
+                flight = self.tasks[key] = (task, flight_priority)
+                task.add_done_callback(lambda _: self.tasks.pop(key, None))
+            else:
+                self.suppressed += 1
+        task, flight_priority = flight
+        if flight_priority is not None and priority is not None:
+            flight_priority.raise_to(priority)
+        # Shielded so a cancelled waiter does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+class PrefetchProgress:
+    """Progress of one prefetch run, see AnimeManager.prefetch_series."""
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.started_at = time.time()
+
+    @property
+    def finished(self):
+        return self.done >= self.total
+
+    def eta(self):
+        """Estimated seconds left, from the average time per series so far (None until known)."""
+        if self.finished:
+            return 0
+        if not self.done:
+            return None
+        return (time.time() - self.started_at) / self.done * (self.total - self.done)
+
+class FeedSnapshot:
+    """The feed entries from one successful fetch.
+
+    The version only changes when the feed content changes, so consumers can
+    cheaply tell whether they need to redraw.
+    """
+    def __init__(self, entries=None, version=0, fetched_at=0):
+        self.entries = entries if entries is not None else []
+        self.version = version
+        self.fetched_at = fetched_at
 
 class AnimeManager:
     def __init__(self):
         self.settings = self.load_settings()
+        self.tracked_store = TrackedStore(HISTORY_DB)
         self.tracked_anime = self.load_tracked_anime()
+        self.tracked_matcher = SeriesMatcher(self.tracked_anime)
+        self.series_aliases = SeriesAliases(HISTORY_DB)
+        self.alias_index = None
+        self.rule_engine = None
         self.qb_client = None
-        self.jikan_limiter = RateLimiter(JIKAN_RATE_LIMIT)
+        self.http = HttpClient()
+        self.engine = AsyncEngine(MAX_RETRIES, CONNECT_TIMEOUT, READ_TIMEOUT)
+        self.jikan_limiter = RateLimiter(JIKAN_RATE_LIMIT, JIKAN_MINUTE_LIMIT)
+        self.metadata_cache = MetadataCache(HISTORY_DB)
+        self.lookup_misses = MissCache(HISTORY_DB)
+        self.prefetch_progress = PrefetchProgress(0)
+        # Coalesces concurrent metadata and cover fetches for the same series
+        self.single_flight = SingleFlight()
+        self.feed_state = self.load_feed_state()
+        self.prune_feed_cache()
+        self.feed_state_lock = threading.Lock()
+        self.parsed_feeds = {}
+        self.merged_feed = (None, None)
+        self.feed_timings = {}
+        self.snapshot_lock = threading.Lock()
+        self.feed_snapshot = FeedSnapshot()
+        self.schedule_data = None
+        self.schedule_fetched_at = 0
+        self.history = FeedHistory(HISTORY_DB)
+        self.download_guard = DownloadGuard(HISTORY_DB)
+        self.torrent_queue = TorrentQueue(self.add_torrents, self.find_torrents)
+        self.new_entries = []
+        self.poll_scheduler = PollScheduler()
 
     def load_settings(self):
         if os.path.exists(SETTINGS_FILE):
@@ -55,79 +337,718 @@ class AnimeManager:
         with open(SETTINGS_FILE, "w") as f:
             json.dump(settings, f)
         self.settings = settings
+        self.rule_engine = None
+
+    def migrate_tracked_file(self):
+        """Import the legacy tracked_anime.txt into the tracked store once.
+
+        Lines may be bare series names or full episode titles; both become a
+        series record. The text file is renamed so it is not imported again.
+        """
+        if not os.path.exists(TRACKED_FILE):
+            return
+        with open(TRACKED_FILE, "r") as f:
+            lines = [line.strip() for line in f.readlines() if line.strip()]
+        series = {}
+        for line in lines:
+            series_name = parse_release(line).series
+            series.setdefault(SeriesMatcher.key_for(series_name), series_name)
+        self.tracked_store.import_series(series.items())
+        os.replace(TRACKED_FILE, TRACKED_FILE + ".migrated")
+        print(f"Migrated {len(series)} tracked series from {TRACKED_FILE}")
 
     def load_tracked_anime(self):
-        if os.path.exists(TRACKED_FILE):
-            with open(TRACKED_FILE, "r") as f:
-                return [line.strip() for line in f.readlines()]
-        return []
+        self.migrate_tracked_file()
+        return [record["name"] for record in self.tracked_store.all()]
 
     def save_tracked_anime(self, tracked):
-        with open(TRACKED_FILE, "w") as f:
-            f.write("\n".join(tracked))
-        self.tracked_anime = tracked
+        """Make the tracked store hold exactly `tracked`, writing only the changes."""
+        wanted = {SeriesMatcher.key_for(name): name for name in tracked}
+        for record in self.tracked_store.all():
+            if record["key"] not in wanted:
+                self.tracked_store.delete(record["key"])
+        for key, name in wanted.items():
+            if self.tracked_store.get(key) is None:
+                self.tracked_store.upsert(key, name)
+        self.tracked_anime = list(tracked)
+        self.tracked_matcher.update(tracked)
+        self.alias_index = None
+        self.rule_engine = None
+
+    def reload_tracked_anime(self):
+        """Re-read the tracked list, e.g. after another process changed it."""
+        self.tracked_anime = self.load_tracked_anime()
+        self.tracked_matcher.update(self.tracked_anime)
+        self.alias_index = None
+        self.rule_engine = None
+
+    def is_tracked(self, title):
+        """Whether a series name or release title belongs to a tracked series."""
+        return self.tracked_matcher.match(title) is not None
+
+    def track_series(self, series_name, **fields):
+        """Start tracking a series, optionally with mal_id/resolution/last_episode."""
+        series_name = parse_release(series_name).series
+        key = SeriesMatcher.key_for(series_name)
+        if "mal_id" not in fields:
+            # Keep the MAL id the series already resolved to
+            record = self.tracked_store.get(key) or self.metadata_cache.get(key)
+            if record and record["mal_id"]:
+                fields["mal_id"] = record["mal_id"]
+        self.tracked_store.upsert(key, series_name, **fields)
+        self.rule_engine = None
+        if series_name not in self.tracked_matcher:
+            self.tracked_anime.append(series_name)
+            self.tracked_matcher.add(series_name)
+            self.alias_index = None
+
+    def untrack_series(self, series_name):
+        """Stop tracking the series with exactly this normalized name."""
+        for name in self.tracked_matcher.exact_names(series_name):
+            self.tracked_store.delete(SeriesMatcher.key_for(name))
+            self.tracked_anime.remove(name)
+            self.tracked_matcher.remove(name)
+            self.alias_index = None
+            self.rule_engine = None
+
+    def get_rule_engine(self):
+        """Return the compiled download rules, recompiling after settings or tracking changes.
+
+        Rules live in the "download_rules" setting: global "include"/"exclude"
+        regex lists, "resolutions", "allow_batches", and a "series" dict with
+        the same keys plus "min_episode" per tracked series name.
+        """
+        engine = self.rule_engine
+        if engine is None:
+            engine = RuleEngine(self.settings.get("download_rules"), self.tracked_store.all())
+            self.rule_engine = engine
+        return engine
+
+    def select_downloads(self, entries, match_series=None):
+        """Return the entries the download rules accept, one release per episode."""
+        return self.get_rule_engine().evaluate(entries, match_series or self.tracked_matcher.match)
+
+    def get_alias_index(self):
+        """Return the alias index, rebuilding it if tracked series, schedule or aliases changed."""
+        index = self.alias_index
+        if index is None:
+            index = AliasIndex()
+            for name in self.tracked_anime:
+                index.add(name, source="tracked")
+            for name, aliases in self.series_aliases.all().items():
+                index.add(name, aliases, source="metadata")
+            for shows in (self.schedule_data or {}).get("schedule", {}).values():
+                for show in shows:
+                    index.add(show["title"], source="schedule")
+            self.alias_index = index
+        return index
+
+    def resolve_series(self, title, min_confidence=None, sources=None):
+        """Return the AliasMatch of the known series a title most likely refers to."""
+        if min_confidence is None:
+            return self.get_alias_index().lookup(title, sources=sources)
+        return self.get_alias_index().lookup(title, min_confidence, sources)
+
+    def find_tracked_series(self, title):
+        """Return the tracked name a title refers to, also across alternative titles."""
+        name = self.tracked_matcher.match(title)
+        if name is not None:
+            return name
+        match = self.resolve_series(title, TRACKED_ALIAS_CONFIDENCE, ("tracked", "metadata"))
+        return self.tracked_matcher.match(match.name) if match else None
+
+    def learn_aliases(self, series_name, anime):
+        """Remember the alternative titles of a Jikan anime record for a series."""
+        aliases = [anime.get("title"), anime.get("title_english"), *anime.get("title_synonyms", [])]
+        aliases.extend(title.get("title") for title in anime.get("titles", []))
+        if self.series_aliases.add(series_name, [alias for alias in aliases if alias != series_name]):
+            self.alias_index = None
+
+    def get_tracked_record(self, title):
+        """Return the tracked series record matching a title, or None."""
+        name = self.tracked_matcher.match(title)
+        return self.tracked_store.get(SeriesMatcher.key_for(name)) if name else None
+
+    def mark_episode_grabbed(self, title):
+        """Remember the last episode sent to qBittorrent for a tracked series."""
+        record = self.get_tracked_record(title)
+        release = parse_release(title)
+        if not record or release.episode is None:
+            return
+        # Feeds list newest first, and older episodes can be grabbed later on
+        last = re.match(r"(\d+(?:\.\d+)?)(?:-(\d+(?:\.\d+)?))?", record.get("last_episode") or "")
+        if last and float(last.group(2) or last.group(1)) >= float(release.episode_end or release.episode):
+            return
+        self.tracked_store.upsert(record["key"], record["name"], last_episode=release.episode_label)
+
+    def load_feed_state(self):
+        """Load the ETag/Last-Modified validators saved for each feed URL."""
+        if os.path.exists(FEED_STATE_FILE):
+            try:
+                with open(FEED_STATE_FILE, "r") as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Error loading feed state: {e}")
+        return {}
+
+    def prune_feed_cache(self):
+        """Drop validators and cached bodies of URLs that are no longer feed sources."""
+        urls = {source["url"] for source in self.get_feed_sources()}
+        stale = [url for url in self.feed_state if url not in urls]
+        for url in stale:
+            del self.feed_state[url]
+        if stale:
+            self.save_feed_state()
+        keep = {os.path.basename(self.get_feed_cache_path(url)) for url in urls}
+        for file in os.listdir(FEED_CACHE_DIR):
+            if file.endswith(".xml") and file not in keep:
+                os.remove(os.path.join(FEED_CACHE_DIR, file))
+
+    def save_feed_state(self):
+        with open(FEED_STATE_FILE, "w") as f:
+            json.dump(self.feed_state, f)
+
+    def get_feed_cache_path(self, url):
+        url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(FEED_CACHE_DIR, f"{url_hash}.xml")
 
     def get_cached_image_path(self, title):
         safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
         return os.path.join(CACHE_DIR, f"{safe_title}.jpg")
 
+    async def search_jikan(self, series_name, priority=PRIORITY_VISIBLE):
+        """Return the best Jikan search result for a series, or None if there is none.
+
+        Network and HTTP errors are raised, so they are not mistaken for a miss.
+        """
+        response = await self.engine.get(
+            "https://api.jikan.moe/v4/anime",
+            limiter=self.jikan_limiter,
+            priority=priority,
+            params={"q": series_name, "limit": 1}
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"][0] if data.get("data") else None
+
+    async def fetch_jikan_anime(self, mal_id, priority=PRIORITY_VISIBLE):
+        """Return the Jikan record of a MAL id, or None if the id no longer exists."""
+        response = await self.engine.get(
+            f"https://api.jikan.moe/v4/anime/{mal_id}",
+            limiter=self.jikan_limiter,
+            priority=priority
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json().get("data")
+
+    def get_pinned_mal_id(self, key, record=None):
+        """Return the MAL id a series resolved to before, or None.
+
+        An id set on the tracked series wins over the one in the metadata cache.
+        """
+        tracked = self.tracked_store.get(key)
+        if tracked and tracked["mal_id"]:
+            return tracked["mal_id"]
+        return record["mal_id"] if record else None
+
+    def get_miss_key(self, title, kind):
+        return f"{SeriesMatcher.key_for(parse_release(title).series)}:{kind}"
+
+    def invalidate_lookup_misses(self, title=None):
+        """Retry lookups that found nothing, for one series or for all of them.
+
+        Returns the number of remembered misses dropped.
+        """
+        prefix = self.get_miss_key(title, "") if title else ""
+        return self.lookup_misses.invalidate(prefix)
+
+    def get_cached_metadata(self, title, fields=METADATA_TTLS):
+        """Return (series name, key, cached record, whether `fields` are fresh)."""
+        series_name = parse_release(title).series
+        key = SeriesMatcher.key_for(series_name)
+        record = self.metadata_cache.get(key)
+        fresh = False
+        if record is not None:
+            age = time.time() - record["fetched_at"]
+            fresh = all(age < METADATA_TTLS[field] for field in fields)
+        if not fresh:
+            # A recent search found nothing; don't ask again yet
+            fresh = self.lookup_misses.is_missing(f"{key}:metadata", NEGATIVE_CACHE_TTL)
+        return series_name, key, record, fresh
+
+    def get_anime_metadata(self, title, fields=METADATA_TTLS, fetch=True, priority=PRIORITY_VISIBLE):
+        """Return the cached Jikan metadata of a series, refreshing stale fields.
+
+        The record is refetched when any of `fields` is older than its
+        METADATA_TTLS entry. With fetch=False, or when Jikan is unreachable,
+        whatever is cached is returned (possibly None). `priority` orders the
+        Jikan request against other pending ones. Blocks while fetching; see
+        get_anime_metadata_async.
+        """
+        series_name, key, record, fresh = self.get_cached_metadata(title, fields)
+        if fresh or not fetch:
+            return record
+        return self.engine.run(self.single_flight.do_async(
+            ("metadata", key), self.refresh_anime_metadata, series_name, key, record, priority=priority
+        ))
+
+    async def get_anime_metadata_async(self, title, fields=METADATA_TTLS, priority=PRIORITY_VISIBLE):
+        """Coroutine version of get_anime_metadata, for the engine loop."""
+        series_name, key, record, fresh = self.get_cached_metadata(title, fields)
+        if fresh:
+            return record
+        return await self.single_flight.do_async(
+            ("metadata", key), self.refresh_anime_metadata, series_name, key, record, priority=priority
+        )
+
+    async def refresh_anime_metadata(self, series_name, key, record=None, priority=PRIORITY_VISIBLE):
+        """Fetch and cache the Jikan metadata of a series, returning `record` on failure.
+
+        A series is searched by name only until it has a MAL id; after that
+        its record is fetched directly by id.
+        """
+        mal_id = self.get_pinned_mal_id(key, record)
+        try:
+            anime = await self.fetch_jikan_anime(mal_id, priority) if mal_id else None
+            if anime is None:
+                if mal_id:
+                    print(f"MAL id {mal_id} of {series_name} no longer exists, searching by name")
+                anime = await self.search_jikan(series_name, priority)
+        except Exception as e:
+            print(f"Error searching Jikan for {series_name}: {e!r}")
+            return record
+        if anime is None:
+            print(f"No Jikan match for {series_name}, not searching again for {NEGATIVE_CACHE_TTL // 3600}h")
+            self.lookup_misses.add(f"{key}:metadata")
+            return record
+        self.learn_aliases(series_name, anime)
+        self.pin_mal_id(series_name, key, record, anime.get("mal_id"))
+        self.metadata_cache.put(key, {
+            "name": series_name,
+            "mal_id": anime.get("mal_id"),
+            "title": anime.get("title"),
+            "status": anime.get("status"),
+            "synopsis": anime.get("synopsis"),
+            "image_url": anime.get("images", {}).get("jpg", {}).get("large_image_url"),
+            "genres": [genre.get("name") for genre in anime.get("genres", [])],
+            "episodes": anime.get("episodes")
+        })
+        return self.metadata_cache.get(key)
+
+    def pin_mal_id(self, series_name, key, record, mal_id):
+        """Remember the MAL id a series resolved to, dropping a cover of a different show."""
+        tracked = self.tracked_store.get(key)
+        if tracked and tracked["mal_id"] != mal_id:
+            self.tracked_store.upsert(key, tracked["name"], mal_id=mal_id)
+        if record and record["mal_id"] and record["mal_id"] != mal_id:
+            cache_path = self.get_cached_image_path(series_name)
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+
+    def get_series_status(self, title, fetch=True):
+        """Return "Ended" or "Ongoing" for a series; Ongoing if unknown."""
+        record = self.get_anime_metadata(title, ("status",), fetch)
+        status = ((record or {}).get("status") or "").lower()
+        return "Ended" if "finished" in status or "completed" in status else "Ongoing"
+
+    def refresh_series_statuses(self, names=None, on_change=None):
+        """Refresh the airing status of series in the background.
+
+        `names` defaults to the tracked series. Only statuses older than
+        METADATA_TTLS["status"] are fetched, at background priority, and the
+        results are persisted in the metadata cache. `on_change(name, status)`
+        is called from the engine thread for every series whose status
+        changed. Returns a Future of the number of series refreshed.
+        """
+        names = list(self.tracked_anime if names is None else names)
+        stale = [name for name in names if not self.get_cached_metadata(name, ("status",))[3]]
+        return self.engine.submit(self.refresh_series_statuses_async(stale, on_change))
+
+    async def refresh_series_statuses_async(self, names, on_change=None):
+        async def refresh(name):
+            status = self.get_series_status(name, fetch=False)
+            await self.get_anime_metadata_async(name, ("status",), PRIORITY_BACKGROUND)
+            new_status = self.get_series_status(name, fetch=False)
+            if new_status != status and on_change:
+                on_change(name, new_status)
+
+        await asyncio.gather(*(refresh(name) for name in names))
+        return len(names)
+
     def fetch_anime_image(self, title):
-        # Clean up the title
-        clean_title = title.replace("[SubsPlease]", "").strip()
-        clean_title = clean_title.split(" - ")[0].strip()
-        clean_title = clean_title.split("[")[0].strip()
+        """Return the cached cover path of a series, downloading it if needed."""
+        cache_path = self.get_cached_image_path(parse_release(title).series)
+        if os.path.exists(cache_path):
+            return cache_path
+        if self.lookup_misses.is_missing(self.get_miss_key(title, "image"), NEGATIVE_CACHE_TTL):
+            return PLACEHOLDER_IMAGE
+        return self.engine.run(self.fetch_anime_image_async(title))
+
+    def fetch_anime_images(self, titles, priority=PRIORITY_VISIBLE):
+        """Start cover downloads for many titles at once on the engine loop.
+
+        Returns {title: concurrent.futures.Future} resolving to image paths.
+        """
+        return {title: self.engine.submit(self.fetch_anime_image_async(title, priority)) for title in titles}
+
+    async def fetch_anime_image_async(self, title, priority=PRIORITY_VISIBLE):
+        clean_title = parse_release(title).series
 
         # Check cache
         cache_path = self.get_cached_image_path(clean_title)
         if os.path.exists(cache_path):
-            print(f"Using cached image for {clean_title}")
             return cache_path
+        if self.lookup_misses.is_missing(self.get_miss_key(clean_title, "image"), NEGATIVE_CACHE_TTL):
+            return PLACEHOLDER_IMAGE
+
+        return await self.single_flight.do_async(
+            ("image", cache_path), self.download_anime_image, clean_title, cache_path, priority=priority
+        )
+
+    async def download_anime_image(self, clean_title, cache_path, priority=PRIORITY_VISIBLE):
+        """Download the cover of a series into the image cache and return its path."""
+        if os.path.exists(cache_path):
+            return cache_path
+
+        record = await self.get_anime_metadata_async(clean_title, ("image_url",), priority)
+        image_url = record and record["image_url"]
+        if not image_url:
+            return PLACEHOLDER_IMAGE
+
+        try:
+            img_response = await self.engine.get(image_url)
+            if img_response.status_code in (404, 410):
+                print(f"Cover of {clean_title} not found, not retrying for {NEGATIVE_CACHE_TTL // 3600}h")
+                self.lookup_misses.add(self.get_miss_key(clean_title, "image"))
+                return PLACEHOLDER_IMAGE
+            img_response.raise_for_status()
+
+            # Write to a temporary file first so readers never see a partial image
+            temp_path = cache_path + ".part"
+            with open(temp_path, 'wb') as f:
+                f.write(img_response.content)
+            os.replace(temp_path, cache_path)
+
+            print(f"Successfully cached image for {clean_title}")
+            return cache_path
+
+        except Exception as e:
+            print(f"Error fetching image for {clean_title}: {e!r}")
+            return PLACEHOLDER_IMAGE
+
+    def needs_prefetch(self, series_name):
+        """Whether a series is missing a cover or fresh metadata."""
+        if not self.get_cached_metadata(series_name)[3]:
+            return True
+        cache_path = self.get_cached_image_path(series_name)
+        return not os.path.exists(cache_path) and \
+            not self.lookup_misses.is_missing(self.get_miss_key(series_name, "image"), NEGATIVE_CACHE_TTL)
 
-        for attempt in range(MAX_RETRIES):
+    def prefetch_series(self, titles, priority=PRIORITY_BACKGROUND, on_progress=None):
+        """Warm the metadata and cover caches for the series of `titles`.
+
+        Series are deduplicated and queued in the given order at `priority`,
+        so the first cards of a grid are resolved first and card loaders find
+        them cached (or join the fetch already in flight). `on_progress` is
+        called from the engine thread with the PrefetchProgress after each
+        series. Returns a Future of the progress.
+        """
+        series_names = {}
+        for title in titles:
+            series_name = parse_release(title or "").series
+            if series_name:
+                series_names.setdefault(SeriesMatcher.key_for(series_name), series_name)
+        pending = [series_name for series_name in series_names.values() if self.needs_prefetch(series_name)]
+
+        progress = PrefetchProgress(len(pending))
+        self.prefetch_progress = progress
+        if pending:
+            print(f"Prefetching metadata and covers for {len(pending)} series")
+        return self.engine.submit(self.prefetch_series_async(pending, priority, progress, on_progress))
+
+    async def prefetch_series_async(self, series_names, priority, progress, on_progress=None):
+        async def prefetch(series_name):
             try:
-                self.jikan_limiter.wait()
-                query_url = f"https://api.jikan.moe/v4/anime?q={clean_title}&limit=1"
-                response = requests.get(query_url)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("data") and data["data"]:
-                    image_url = data["data"][0]["images"]["jpg"]["large_image_url"]
-                    if image_url:
-                        img_response = requests.get(image_url)
-                        img_response.raise_for_status()
-                        
-                        with open(cache_path, 'wb') as f:
-                            f.write(img_response.content)
-                        
-                        print(f"Successfully cached image for {clean_title}")
-                        return cache_path
-                
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(1)
-                    
+                await self.fetch_anime_image_async(series_name, priority)
+                await self.get_anime_metadata_async(series_name, priority=priority)
             except Exception as e:
-                print(f"Error fetching image for {clean_title} (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(1)
-        
-        return PLACEHOLDER_IMAGE
+                print(f"Error prefetching {series_name}: {e!r}")
+            progress.done += 1
+            if on_progress:
+                on_progress(progress)
 
-    def fetch_rss_feed(self):
+        # Tasks are created in order, so they queue at the rate limiter in order
+        await asyncio.gather(*(prefetch(series_name) for series_name in series_names))
+        if on_progress and not series_names:
+            on_progress(progress)
+        return progress
+
+    def get_feed_sources(self):
+        """Return the configured feed sources, most preferred first.
+
+        Each source is a dict with a `name`, a `url` and optionally `stream`
+        to parse it incrementally (see `stream_feeds`). Without a
+        `feed_sources` setting the single `rss_url` is used.
+        """
+        sources = self.settings.get("feed_sources")
+        if sources:
+            return sources
+        return [{"name": "default", "url": self.settings["rss_url"]}]
+
+    def request_feed(self, url, stream=False):
+        """GET a feed URL, sending the saved validators when the body is cached."""
+        cache_path = self.get_feed_cache_path(url)
+        state = self.feed_state.get(url, {})
+
+        # Only send validators if we can still answer a 304 from the cached body
+        headers = {}
+        if os.path.exists(cache_path):
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("modified"):
+                headers["If-Modified-Since"] = state["modified"]
+
+        return self.http.get(url, headers=headers, stream=stream)
+
+    def save_feed_validators(self, url, response):
+        with self.feed_state_lock:
+            self.feed_state[url] = {
+                "etag": response.headers.get("ETag"),
+                "modified": response.headers.get("Last-Modified")
+            }
+            self.save_feed_state()
+
+    def tee_feed_body(self, url, response):
+        """Yield the body of a streamed response while writing it to the feed cache.
+
+        The cache file is only replaced once the whole body has been read.
+        """
+        cache_path = self.get_feed_cache_path(url)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+                yield chunk
+        os.replace(tmp_path, cache_path)
+
+    def iter_feed(self, url):
+        """Stream a feed as compact FeedEntry records.
+
+        Nothing but the current item is held in memory, so this is the way to
+        read large archive or search feeds. These are one-off queries, so
+        unlike fetch_feed_source no validators or cached body are kept.
+        """
+        response = self.http.get(url, stream=True)
+        with response:
+            response.raise_for_status()
+            yield from iter_feed_entries(response.iter_content(chunk_size=CHUNK_SIZE))
+
+    def fetch_feed_source(self, url, stream=False):
+        """Fetch one feed URL with a conditional GET.
+
+        The ETag/Last-Modified validators and the raw body are kept on disk, so
+        an unchanged feed costs a 304 and no parsing: the previously parsed feed
+        is returned (or re-read from the cached body after a restart). With
+        `stream` the body is parsed incrementally into FeedEntry records
+        instead of a full feedparser tree.
+        """
+        cache_path = self.get_feed_cache_path(url)
         try:
-            feed = feedparser.parse(self.settings["rss_url"])
+            response = self.request_feed(url, stream=stream)
+            with response:
+                if response.status_code == 304:
+                    if url not in self.parsed_feeds:
+                        if stream:
+                            entries = iter_feed_entries(iter_file_chunks(cache_path))
+                            self.parsed_feeds[url] = ParsedFeed(list(entries))
+                        else:
+                            with open(cache_path, "rb") as f:
+                                self.parsed_feeds[url] = feedparser.parse(f.read())
+                    return self.parsed_feeds[url]
+
+                response.raise_for_status()
+                if stream:
+                    feed = ParsedFeed(list(iter_feed_entries(self.tee_feed_body(url, response))))
+                else:
+                    feed = feedparser.parse(response.content)
+                    tmp_path = cache_path + ".tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(response.content)
+                    os.replace(tmp_path, cache_path)
+
+            self.save_feed_validators(url, response)
+            self.parsed_feeds[url] = feed
             return feed
         except Exception as e:
-            print(f"Error fetching RSS feed: {e}")
+            print(f"Error fetching RSS feed {url}: {e}")
             return None
 
+    def get_entry_dedupe_keys(self, entry):
+        """Keys under which two feed entries count as the same release."""
+        keys = []
+        infohash = self.get_entry_infohash(entry)
+        if infohash:
+            keys.append(("infohash", infohash))
+        release = parse_release(entry.get("title", ""))
+        if release.episode is not None:
+            keys.append(("episode", release.series, release.episode_label))
+        else:
+            keys.append(("title", entry.get("title", "")))
+        return keys
+
+    def merge_feed_entries(self, feeds):
+        """Merge the entries of several feeds, given in preference order.
+
+        An entry is dropped if an earlier (preferred) feed already carried the
+        same infohash or the same series and episode. The result is ordered
+        newest first.
+        """
+        seen = set()
+        merged = []
+        for feed in feeds:
+            for entry in feed.entries:
+                keys = self.get_entry_dedupe_keys(entry)
+                if any(key in seen for key in keys):
+                    continue
+                seen.update(keys)
+                merged.append(entry)
+        merged.sort(key=lambda entry: tuple(entry.get("published_parsed") or ()), reverse=True)
+        return merged
+
+    def fetch_rss_feed(self):
+        """Fetch every feed source in parallel and return the merged entries.
+
+        Returns None if no source could be fetched. When no source changed the
+        previously merged list object is returned as is.
+        """
+        sources = self.get_feed_sources()
+
+        def timed_fetch(source):
+            start = time.perf_counter()
+            stream = source.get("stream", self.settings.get("stream_feeds", False))
+            feed = self.fetch_feed_source(source["url"], stream=stream)
+            return feed, time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=min(FEED_WORKERS, len(sources))) as pool:
+            results = list(pool.map(timed_fetch, sources))
+
+        self.feed_timings = {}
+        for source, (feed, elapsed) in zip(sources, results):
+            self.feed_timings[source["name"]] = {
+                "seconds": elapsed,
+                "entries": len(feed.entries) if feed is not None else None
+            }
+            status = f"{len(feed.entries)} entries" if feed is not None else "failed"
+            print(f"Feed {source['name']}: {status} in {elapsed:.2f}s")
+
+        feeds = [feed for feed, _ in results if feed is not None]
+        if not feeds:
+            return None
+
+        # Parsed feeds are reused on 304, so identical objects mean no change
+        feed_ids = tuple(id(feed) for feed in feeds)
+        if self.merged_feed[0] != feed_ids:
+            self.merged_feed = (feed_ids, self.merge_feed_entries(feeds))
+        return self.merged_feed[1]
+
+    def load_feed(self):
+        """Refresh the shared feed snapshot and return it.
+
+        Every call fetches (conditionally, so an unchanged feed costs a 304);
+        the poll scheduler decides how often. On a failed fetch the previous
+        snapshot is kept.
+        """
+        snapshot = self.feed_snapshot
+        entries = self.fetch_rss_feed()
+        if entries is None:
+            return snapshot
+
+        with self.snapshot_lock:
+            current = self.feed_snapshot
+            if entries is current.entries:
+                # 304 Not Modified: same content, just a fresher timestamp
+                version = current.version
+                self.new_entries = []
+            else:
+                version = current.version + 1
+                self.new_entries = self.record_feed_entries(entries)
+            self.feed_snapshot = FeedSnapshot(entries, version, time.time())
+
+        new_series = {self.find_tracked_series(entry.get("title", "")) for entry in self.new_entries}
+        new_series.discard(None)
+        self.poll_scheduler.record_poll(new_series, self.get_tracked_air_times())
+        return self.feed_snapshot
+
+    def get_tracked_air_times(self, now=None):
+        """(tracked name, last air, next air) of every tracked show in the schedule."""
+        return get_air_times(self.get_schedule(), self.find_tracked_series, now or datetime.utcnow())
+
+    def next_poll_delay(self):
+        """Seconds until the feed should be polled again, based on tracked air times."""
+        return self.poll_scheduler.next_delay(self.get_tracked_air_times())
+
+    def get_entry_infohash(self, entry):
+        infohash = entry.get("nyaa_infohash")
+        if infohash:
+            return infohash.lower()
+        match = re.search(r"btih:([0-9a-fA-F]{40})", entry.get("link", ""))
+        return match.group(1).lower() if match else None
+
+    def describe_entry(self, entry):
+        """Build the history record for a feed entry."""
+        title = entry.get("title", "")
+        release = parse_release(title)
+        return {
+            "guid": entry.get("id") or entry.get("link") or title,
+            "infohash": self.get_entry_infohash(entry),
+            "title": title,
+            "link": entry.get("link"),
+            "series": release.series,
+            "episode": release.episode_label or None
+        }
+
+    def record_feed_entries(self, entries):
+        """Record entries in the feed history and return the unseen ones."""
+        try:
+            records = [self.describe_entry(entry) for entry in entries]
+            new_guids = {record["guid"] for record in self.history.record_entries(records)}
+            return [entry for entry, record in zip(entries, records) if record["guid"] in new_guids]
+        except Exception as e:
+            print(f"Error recording feed history: {e}")
+            return []
+
+    def get_feed_snapshot(self):
+        """Return the current feed snapshot without touching the network."""
+        return self.feed_snapshot
+
+    def load_schedule(self, force=False):
+        """Refresh the cached schedule if it is older than SCHEDULE_TTL."""
+        if not force and self.schedule_data and time.time() - self.schedule_fetched_at < SCHEDULE_TTL:
+            return self.schedule_data
+
+        schedule_data = self.fetch_schedule()
+        if schedule_data:
+            self.schedule_data = schedule_data
+            self.schedule_fetched_at = time.time()
+            self.alias_index = None
+        return self.schedule_data
+
+    def get_schedule(self):
+        """Return the cached schedule without touching the network."""
+        return self.schedule_data
+
     def fetch_schedule(self):
+        return self.engine.run(self.fetch_schedule_async())
+
+    async def fetch_schedule_async(self):
         try:
-            response = requests.get("https://subsplease.org/api/?f=schedule&tz=UTC")
+            response = await self.engine.get("https://subsplease.org/api/?f=schedule&tz=UTC")
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            print(f"Error fetching schedule: {e}")
+            print(f"Error fetching schedule: {e!r}")
             return None
 
     def setup_qbittorrent(self):
@@ -143,21 +1064,189 @@ class AnimeManager:
             print(f"Failed to connect to qBittorrent: {e}")
             return False
 
-    def add_torrent(self, link, category=None):
-        """Add a torrent to qBittorrent with optional category."""
-        try:
-            if not self.qb_client:
-                return False
-            
-            # Add torrent with category
-            self.qb_client.torrents_add(
-                urls=[link],
-                category="Anime" if category else None
+    def get_episode_key(self, title):
+        """Duplicate-detection key of a release: series, episode and resolution."""
+        release = parse_release(title or "")
+        if release.episode is None:
+            return None
+        episode = release.episode if release.episode_end is None else f"{release.episode}-{release.episode_end}"
+        return f"{SeriesMatcher.key_for(release.series)}|{episode}|{release.resolution or ''}"
+
+    def add_torrent(self, link, category=None, title=None, infohash=None):
+        """Add a torrent to qBittorrent with optional category.
+
+        Returns TORRENT_ADDED, TORRENT_FAILED, or TORRENT_DUPLICATE without
+        contacting qBittorrent when the infohash or the episode (from `title`)
+        was queued before.
+        """
+        return self.add_releases([(link, title, infohash)], category)[0]
+
+    def add_entry(self, entry, category=None):
+        """Add a feed entry, see add_torrent."""
+        return self.add_entries([entry], category)[0]
+
+    def add_entries(self, entries, category=None):
+        """Add feed entries, see add_releases."""
+        return self.submit_entries(entries, category).result()
+
+    def submit_entries(self, entries, category=None):
+        """Add feed entries without waiting, see submit_releases."""
+        return self.submit_releases(
+            [(entry.get("link"), entry.get("title"), self.get_entry_infohash(entry)) for entry in entries],
+            category
+        )
+
+    def add_releases(self, releases, category=None):
+        """Add (link, title, infohash) releases, skipping duplicates.
+
+        The links go through the torrent queue, so they are sent together with
+        anything else submitted at the same time. Returns one add_torrent
+        result per release, in order.
+        """
+        return self.submit_releases(releases, category).result()
+
+    def submit_releases(self, releases, category=None):
+        """Queue releases like add_releases without blocking.
+
+        Returns a Future of the add_torrent results, resolved on the torrent
+        queue's thread once every link was accepted or gave up.
+        """
+        done = Future()
+        results = []
+        pending = []
+        seen_keys = set()
+        for link, title, infohash in releases:
+            infohash = infohash.lower() if infohash else None
+            episode_key = self.get_episode_key(title)
+            # Reserving also covers releases submitted earlier but not answered yet
+            if (infohash or link) in seen_keys or (episode_key and episode_key in seen_keys) or \
+                    not self.download_guard.reserve(infohash, episode_key):
+                results.append(TORRENT_DUPLICATE)
+                continue
+            seen_keys.update(key for key in (infohash or link, episode_key) if key)
+            pending.append((episode_key, infohash, title, link))
+            results.append(None)
+
+        if not pending:
+            done.set_result(results)
+            return done
+
+        futures = self.torrent_queue.submit(
+            [link for *_, link in pending], category, [infohash for _, infohash, _, _ in pending]
+        )
+        lock = threading.Lock()
+        remaining = [len(futures)]
+
+        def on_submitted(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            statuses = [TORRENT_ADDED if future.result() else TORRENT_FAILED for future in futures]
+            added = [release for release, status in zip(pending, statuses) if status == TORRENT_ADDED]
+            if added:
+                self.download_guard.record(added)
+            self.download_guard.release(
+                [release for release, status in zip(pending, statuses) if status != TORRENT_ADDED]
             )
-            return True
-        except Exception as e:
-            print(f"Failed to add torrent: {str(e)}")
-            return False
+            statuses = iter(statuses)
+            done.set_result([next(statuses) if result is None else result for result in results])
+
+        for future in futures:
+            future.add_done_callback(on_submitted)
+        return done
+
+    def add_torrents(self, links, category=None):
+        """Add several torrents to qBittorrent in a single request.
+
+        Returns False when qBittorrent rejected all of them; raises when it
+        cannot be reached.
+        """
+        if not self.qb_client:
+            raise ConnectionError("Not connected to qBittorrent")
+        result = self.qb_client.torrents_add(
+            urls=list(links),
+            category="Anime" if category else None
+        )
+        # qBittorrent answers "Fails." when none of the torrents was added
+        return result != "Fails."
+
+    def find_torrents(self, infohashes):
+        """Return which of the given infohashes qBittorrent has."""
+        torrents = self.qb_client.torrents_info(torrent_hashes=list(infohashes))
+        return {torrent.hash.lower() for torrent in torrents} & set(infohashes)
+
+    def get_local_episodes(self, series_name):
+        """Return the episode numbers of a series found in the download folder."""
+        episodes = set()
+        for file in self.get_downloaded_files():
+            release = parse_release(file)
+            if release.series == series_name and release.episode is not None and not release.is_batch:
+                episodes.add(release.episode_number)
+        return episodes
+
+    def fetch_backfill_entries(self, series_name, pages=None):
+        """Fetch the search-result pages for a series concurrently.
+
+        Returns the entries of `series_name` in the configured resolution,
+        across all pages.
+        """
+        pages = pages or self.settings.get("backfill_pages", BACKFILL_PAGES)
+        resolution = self.settings.get("backfill_resolution", "1080p")
+        url_template = self.settings.get("backfill_url", BACKFILL_URL)
+        query = urllib.parse.quote_plus(f"{series_name} {resolution}")
+        urls = [url_template.format(query=query, page=page) for page in range(1, pages + 1)]
+
+        def fetch_page(url):
+            # Filter while streaming, so only the wanted entries are ever kept
+            entries = []
+            try:
+                for entry in self.iter_feed(url):
+                    release = parse_release(entry.get("title", ""))
+                    if release.series == series_name and release.resolution == resolution:
+                        entries.append(entry)
+            except Exception as e:
+                print(f"Error fetching backfill page {url}: {e}")
+            return entries
+
+        entries = []
+        with ThreadPoolExecutor(max_workers=min(FEED_WORKERS, len(urls))) as pool:
+            for page_entries in pool.map(fetch_page, urls):
+                entries.extend(page_entries)
+        return entries
+
+    def backfill_series(self, series_name, pages=None):
+        """Queue the episodes of a series missing from the download folder.
+
+        Episodes that fell off the rolling RSS window are looked up in the
+        search feeds, diffed against the local library and sent to
+        qBittorrent in one batched request. Returns the titles queued.
+        """
+        local_episodes = self.get_local_episodes(series_name)
+        # The rules pick one release per episode (preferred resolution, newest version)
+        candidates = self.select_downloads(
+            self.fetch_backfill_entries(series_name, pages),
+            lambda title: series_name if parse_release(title).series == series_name else None
+        )
+        missing = {}
+        for entry in candidates:
+            release = parse_release(entry.get("title", ""))
+            if release.episode is None or release.is_batch or release.episode_number in local_episodes:
+                continue
+            missing.setdefault(release.episode_number, entry)
+
+        if not missing:
+            print(f"No missing episodes for {series_name}")
+            return []
+
+        entries = [missing[episode] for episode in sorted(missing)]
+        results = self.add_entries(entries, category="Anime")
+        titles = [entry.get("title") for entry, result in zip(entries, results) if result == TORRENT_ADDED]
+        if not titles:
+            return []
+        self.mark_episode_grabbed(titles[-1])
+        print(f"Backfilled {len(titles)} episodes of {series_name}")
+        return titles
 
     def get_downloaded_files(self):
         if not os.path.exists(self.settings["download_folder"]):
@@ -0,0 +1,133 @@
+"""Headless auto-downloader for tracked series.
+
+Polls the RSS feed through AnimeManager and sends every new episode of a
+tracked series to qBittorrent. Polling follows the air times of tracked shows
+unless a fixed --interval is given. It does not import PyQt, so it can run as
+a long-lived process on a server without a display:
+
+    python anime_daemon.py
+"""
+import sys
+import signal
+import argparse
+import threading
+from anime_backend import AnimeManager, TORRENT_ADDED, TORRENT_DUPLICATE
+from anime_parser import parse_release
+
+
+class AutoDownloader:
+    def __init__(self, manager, interval=None):
+        self.manager = manager
+        self.interval = interval
+        self.stop_event = threading.Event()
+
+    def ensure_qbittorrent(self):
+        if self.manager.qb_client:
+            return True
+        if self.manager.setup_qbittorrent():
+            print("qBittorrent connected successfully")
+            return True
+        return False
+
+    def poll_once(self):
+        """Fetch the feed once and queue new episodes of tracked series.
+
+        Returns the number of torrents added.
+        """
+        if not self.ensure_qbittorrent():
+            print("qBittorrent unavailable, skipping poll")
+            return 0
+
+        # Pick up series tracked or untracked from the GUI since the last poll
+        self.manager.reload_tracked_anime()
+
+        # Look at the whole feed every time: the GUI may have recorded entries
+        # first, and failed adds must be retried. The download guard turns
+        # episodes that were already queued into cheap duplicates.
+        snapshot = self.manager.load_feed()
+
+        downloaded = set(self.manager.get_downloaded_files())
+        wanted = []
+        for entry in self.manager.select_downloads(snapshot.entries):
+            title = entry.get("title", "")
+            if any(file.startswith(title) for file in downloaded):
+                continue
+            wanted.append(entry)
+
+        # Submit everything at once so the queue can send a single request
+        results = self.manager.add_entries(wanted, category="Anime")
+        added = 0
+        duplicates = 0
+        for entry, result in zip(wanted, results):
+            title = entry.get("title", "")
+            if result == TORRENT_ADDED:
+                print(f"Started downloading: {title}")
+                self.manager.mark_episode_grabbed(title)
+                added += 1
+            elif result == TORRENT_DUPLICATE:
+                duplicates += 1
+            else:
+                print(f"Failed to start download for: {title}, retrying next poll")
+        if duplicates:
+            print(f"Skipped {duplicates} episodes already queued")
+        return added
+
+    def backfill(self):
+        """Queue missed episodes of every tracked series."""
+        if not self.ensure_qbittorrent():
+            print("qBittorrent unavailable, skipping backfill")
+            return 0
+        series_names = sorted({parse_release(anime).series for anime in self.manager.load_tracked_anime()})
+        return sum(len(self.manager.backfill_series(series_name)) for series_name in series_names)
+
+    def next_delay(self):
+        if self.interval:
+            return self.interval
+        return self.manager.next_poll_delay()
+
+    def run(self):
+        print(f"Watching {len(self.manager.tracked_anime)} tracked series")
+        while not self.stop_event.is_set():
+            try:
+                self.manager.load_schedule()
+                self.poll_once()
+            except Exception as e:
+                print(f"Error during poll: {e}")
+            delay = self.next_delay()
+            print(f"Next poll in {delay:.0f}s")
+            self.stop_event.wait(delay)
+        print("Auto-downloader stopped")
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Automatically download new episodes of tracked anime")
+    parser.add_argument("--interval", type=int, default=None,
+                        help="poll every N seconds instead of following tracked air times")
+    parser.add_argument("--once", action="store_true",
+                        help="poll the feed a single time and exit")
+    parser.add_argument("--backfill", action="store_true",
+                        help="queue missed episodes of tracked series before polling")
+    args = parser.parse_args()
+
+    downloader = AutoDownloader(AnimeManager(), interval=args.interval)
+    if args.backfill:
+        downloader.backfill()
+    if args.once:
+        downloader.poll_once()
+        return 0
+
+    def signal_handler(signum, frame):
+        print("\nStopping auto-downloader...")
+        downloader.stop()
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    downloader.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
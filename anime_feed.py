@@ -0,0 +1,95 @@
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+
+CHUNK_SIZE = 64 * 1024
+NYAA_NAMESPACE = "{https://nyaa.si/xmlns/nyaa}"
+
+
+class FeedEntry:
+    """Compact record of one RSS item.
+
+    Field names follow feedparser (`id` for the guid, `nyaa_infohash` for the
+    nyaa extension) and `get` behaves like FeedParserDict.get, so the rest of
+    the code can handle both kinds of entry the same way.
+    """
+    __slots__ = ("title", "link", "id", "published", "published_parsed",
+                 "nyaa_infohash", "nyaa_size", "nyaa_category")
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, None)
+
+    def get(self, key, default=None):
+        if key not in self.__slots__:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __repr__(self):
+        return f"FeedEntry(title={self.title!r})"
+
+
+class ParsedFeed:
+    """Minimal stand-in for a feedparser result: just the entries."""
+    def __init__(self, entries):
+        self.entries = entries
+
+
+def _local_name(tag):
+    if tag.startswith(NYAA_NAMESPACE):
+        return "nyaa_" + tag[len(NYAA_NAMESPACE):].lower()
+    return tag.rsplit("}", 1)[-1]
+
+
+def _build_entry(item):
+    entry = FeedEntry()
+    for child in item:
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+        if name == "guid":
+            entry.id = text
+        elif name == "pubDate":
+            entry.published = text
+            try:
+                entry.published_parsed = parsedate_to_datetime(text).utctimetuple()
+            except (TypeError, ValueError):
+                pass
+        elif name in ("title", "link", "nyaa_infohash", "nyaa_size", "nyaa_category"):
+            setattr(entry, name, text)
+    return entry
+
+
+def iter_feed_entries(chunks):
+    """Incrementally parse RSS bytes and yield a FeedEntry per <item>.
+
+    `chunks` is any iterable of bytes. Each item element is detached from the
+    tree once converted, so memory stays flat however many items the feed has.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []
+
+    def drain():
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local_name(elem.tag) == "item":
+                yield _build_entry(elem)
+                if stack:
+                    stack[-1].remove(elem)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def iter_file_chunks(path, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
@@ -7,28 +7,94 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QPushButton, QLineEdit, QGridLayout, QFrame,
                            QStackedWidget, QListWidget, QFileDialog, QMessageBox,
                            QTextEdit, QDialog, QButtonGroup, QSizePolicy, QProgressBar)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QPropertyAnimation, QPoint, QEasingCurve
+from PyQt6.QtCore import (Qt, QThread, QObject, pyqtSignal, pyqtSlot, QSize, QTimer,
+                          QPropertyAnimation, QPoint, QEasingCurve)
 from PyQt6.QtGui import QPixmap, QImage, QPalette, QColor, QFont
 import os
 from datetime import datetime, timedelta
-from anime_backend import AnimeManager
+from anime_backend import AnimeManager, TORRENT_ADDED, TORRENT_DUPLICATE, PRIORITY_USER, PRIORITY_VISIBLE, PRIORITY_BACKGROUND, PLACEHOLDER_IMAGE
+from anime_parser import parse_release
 
-class ImageLoader(QThread):
+def episode_text(release):
+    """Episode label with resolution, e.g. ``37 (1080p)``"""
+    if release.resolution:
+        return f"{release.episode_label} ({release.resolution})".strip()
+    return release.episode_label
+
+class ImageLoader(QObject):
+    """Loads a cover on the manager's network engine instead of a thread per card.
+
+    The download finishes on the engine thread; the path comes back through
+    a queued signal so the pixmap is built on the GUI thread.
+    """
     image_loaded = pyqtSignal(str, QPixmap)
+    path_loaded = pyqtSignal(str)
     
     def __init__(self, title, manager):
         super().__init__()
         self.title = title
         self.manager = manager
+        self.path_loaded.connect(self.on_path_loaded)
+        
+    def start(self):
+        future = self.manager.fetch_anime_images([self.title])[self.title]
+        future.add_done_callback(self.on_done)
         
-    def run(self):
-        image_path = self.manager.fetch_anime_image(self.title)
+    def on_done(self, future):
+        # Runs on the engine thread
+        self.path_loaded.emit(future.result() if future.exception() is None else PLACEHOLDER_IMAGE)
+        
+    def on_path_loaded(self, image_path):
         if image_path:
             pixmap = QPixmap(image_path)
             scaled_pixmap = pixmap.scaled(300, 420, Qt.AspectRatioMode.KeepAspectRatio, 
                                         Qt.TransformationMode.SmoothTransformation)
             self.image_loaded.emit(self.title, scaled_pixmap)
 
+class FeedWorker(QObject):
+    """Owns every feed and schedule fetch, on its own thread.
+
+    Requests arrive through queued signals and results are emitted back, so
+    the GUI thread never waits on the network.
+    """
+    feed_loaded = pyqtSignal(object)
+    schedule_loaded = pyqtSignal(object)
+    prefetch_progress = pyqtSignal(object)
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+        self.prefetched_feed_version = None
+        self.prefetched_schedule = None
+        
+    @pyqtSlot()
+    def load_feed(self):
+        try:
+            snapshot = self.manager.load_feed()
+            # Start warming caches before the cards exist, first cards first
+            if snapshot.version != self.prefetched_feed_version:
+                self.prefetched_feed_version = snapshot.version
+                self.manager.prefetch_series([entry.get("title") for entry in snapshot.entries],
+                                             PRIORITY_VISIBLE, self.prefetch_progress.emit)
+            self.feed_loaded.emit(snapshot)
+        except Exception as e:
+            print(f"Error loading RSS feed: {str(e)}")
+            self.feed_loaded.emit(self.manager.get_feed_snapshot())
+            
+    @pyqtSlot(bool)
+    def load_schedule(self, force):
+        try:
+            schedule_data = self.manager.load_schedule(force=force)
+            if schedule_data and schedule_data is not self.prefetched_schedule:
+                self.prefetched_schedule = schedule_data
+                titles = [show["title"] for shows in schedule_data.get("schedule", {}).values() for show in shows]
+                self.manager.prefetch_series(list(self.manager.tracked_anime) + titles,
+                                             PRIORITY_BACKGROUND, self.prefetch_progress.emit)
+            self.schedule_loaded.emit(schedule_data)
+        except Exception as e:
+            print(f"Error loading schedule: {str(e)}")
+            self.schedule_loaded.emit(self.manager.get_schedule())
+
 class FlippableCard(QFrame):
     def __init__(self):
         super().__init__()
@@ -43,37 +109,28 @@ class FlippableCard(QFrame):
             self.back_widget.show()
         self.is_flipped = not self.is_flipped
 
-class AnimeInfoLoader(QThread):
+class AnimeInfoLoader(QObject):
+    """Loads a description on the manager's network engine; see ImageLoader."""
     info_loaded = pyqtSignal(str, str)
     
-    def __init__(self, title):
+    def __init__(self, title, manager):
         super().__init__()
         self.title = title
+        self.manager = manager
+        
+    def start(self):
+        # The user flipped the card and is waiting for this one
+        future = self.manager.engine.submit(
+            self.manager.get_anime_metadata_async(self.title, ("synopsis",), priority=PRIORITY_USER)
+        )
+        future.add_done_callback(self.on_done)
         
-    def run(self):
+    def on_done(self, future):
+        # Runs on the engine thread; info_loaded is delivered queued to the card
         try:
-            import requests
-            import time
-            
-            # Clean up title for search
-            search_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
-            
-            # Search for anime
-            response = requests.get(
-                f"https://api.jikan.moe/v4/anime",
-                params={"q": search_title, "limit": 1},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data["data"]:
-                    anime = data["data"][0]
-                    synopsis = anime.get("synopsis", "No description available.")
-                    self.info_loaded.emit(self.title, synopsis)
-                    return
-                    
-            self.info_loaded.emit(self.title, "No description available.")
+            record = future.result()
+            synopsis = record and record["synopsis"]
+            self.info_loaded.emit(self.title, synopsis or "No description available.")
             
         except Exception as e:
             self.info_loaded.emit(self.title, f"Failed to load description: {str(e)}")
@@ -84,6 +141,7 @@ class AnimeCard(FlippableCard):
     def __init__(self, title, manager, parent=None):
         super().__init__()
         self.title = title
+        self.release = parse_release(title)
         self.manager = manager
         self.original_pixmap = None
         self.setup_ui()
@@ -121,8 +179,7 @@ class AnimeCard(FlippableCard):
         self.back_widget.hide()
         
         # Load image
-        clean_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        self.loader = ImageLoader(clean_title, self.manager)
+        self.loader = ImageLoader(self.release.series, self.manager)
         self.loader.image_loaded.connect(self.set_image)
         self.loader.start()
         
@@ -138,8 +195,7 @@ class AnimeCard(FlippableCard):
         layout.addWidget(self.image_label)
         
         # Title
-        clean_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        self.title_label = QLabel(clean_title)
+        self.title_label = QLabel(self.release.series)
         self.title_label.setWordWrap(True)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
@@ -147,8 +203,7 @@ class AnimeCard(FlippableCard):
         layout.addWidget(self.title_label)
         
         # Episode info
-        episode_info = self.title.split(" - ")[-1].split("[")[0].strip()
-        self.episode_label = QLabel(episode_info)
+        self.episode_label = QLabel(episode_text(self.release))
         self.episode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.episode_label.setStyleSheet("color: #666666;")
         self.episode_label.setFixedHeight(20)  # Fixed height for episode info
@@ -178,15 +233,13 @@ class AnimeCard(FlippableCard):
         info_layout = QVBoxLayout(info_frame)
         
         # Title
-        clean_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        title_label = QLabel(clean_title)
+        title_label = QLabel(self.release.series)
         title_label.setStyleSheet("font-weight: bold; font-size: 16px;")
         title_label.setWordWrap(True)
         info_layout.addWidget(title_label)
         
         # Episode
-        episode_info = self.title.split(" - ")[-1].split("[")[0].strip()
-        episode_label = QLabel(f"Episode: {episode_info}")
+        episode_label = QLabel(f"Episode: {episode_text(self.release)}")
         episode_label.setStyleSheet("color: #666666;")
         info_layout.addWidget(episode_label)
         
@@ -197,12 +250,11 @@ class AnimeCard(FlippableCard):
         info_layout.addWidget(self.desc_label)
         
         # Load description
-        self.info_loader = AnimeInfoLoader(self.title)
+        self.info_loader = AnimeInfoLoader(self.title, self.manager)
         self.info_loader.info_loaded.connect(self.update_description)
         
         # Track/Untrack button
-        clean_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        is_tracked = any(clean_title in anime for anime in self.manager.tracked_anime)
+        is_tracked = self.manager.is_tracked(self.release.series)
         
         self.track_btn = QPushButton("Untrack Series" if is_tracked else "Track Series")
         self.track_btn.setStyleSheet("""
@@ -223,7 +275,7 @@ class AnimeCard(FlippableCard):
         layout.addWidget(self.track_btn)
         
     def set_image(self, title, pixmap):
-        if title == self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]:
+        if title == self.release.series:
             self.original_pixmap = pixmap
             scaled_pixmap = pixmap.scaled(
                 self.image_label.size(),
@@ -249,8 +301,7 @@ class AnimeCard(FlippableCard):
             self.info_loader.start()
         
     def update_status(self):
-        clean_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        is_tracked = any(clean_title in anime for anime in self.manager.tracked_anime)
+        is_tracked = self.manager.is_tracked(self.release.series)
         self.status_label.setText("✓ Tracking" if is_tracked else "Click to View Info")
         self.status_label.setStyleSheet(
             "color: #00b894; font-weight: bold;" if is_tracked else "color: #0984e3;"
@@ -392,6 +443,7 @@ class TrackedAnimeCard(FlippableCard):
         # Create front and back widgets in the same layout
         self.front_widget = QWidget()
         self.back_widget = QWidget()
+        self.series_status_label = None  # Created by setup_back
         self.setup_front()
         self.setup_back()
         
@@ -489,13 +541,10 @@ class TrackedAnimeCard(FlippableCard):
         info_layout.addWidget(self.countdown_label)
         self.update_countdown()
         
-        # Status
-        status = self.check_series_status()
-        status_label = QLabel(f"Status: {status}")
-        status_label.setStyleSheet(
-            "color: #00b894; font-weight: bold;" if status == "Ongoing" else "color: #d63031; font-weight: bold;"
-        )
-        info_layout.addWidget(status_label)
+        # Status, from the metadata cache; the status service keeps it fresh
+        self.series_status_label = QLabel()
+        info_layout.addWidget(self.series_status_label)
+        self.update_status()
         
         layout.addWidget(info_frame)
         
@@ -545,18 +594,16 @@ class TrackedAnimeCard(FlippableCard):
         self.flip_card()
         
     def get_last_episode(self):
-        downloaded_files = self.manager.get_downloaded_files()
-        latest_episode = "None"
-        
-        for file in downloaded_files:
-            if file.endswith(".mkv") and self.series_name in file:
-                try:
-                    episode = file.split(" - ")[1].split("[")[0].strip()
-                    latest_episode = episode
-                except:
-                    pass
+        latest = None
+        for file in self.manager.get_downloaded_files():
+            release = parse_release(file)
+            if release.extension != "mkv" or release.series != self.series_name:
+                continue
+            if release.episode is not None and (
+                    latest is None or release.episode_number > latest.episode_number):
+                latest = release
                 
-        return latest_episode
+        return latest.episode_label if latest else "None"
         
     def untrack_series(self):
         # Find the MainWindow instance
@@ -571,11 +618,7 @@ class TrackedAnimeCard(FlippableCard):
             return
             
         # Remove series from tracked anime
-        self.manager.tracked_anime = [
-            anime for anime in self.manager.tracked_anime
-            if self.series_name not in anime
-        ]
-        self.manager.save_tracked_anime(self.manager.tracked_anime)
+        self.manager.untrack_series(self.series_name)
         
         # Update all UI elements
         QTimer.singleShot(0, main_window.update_tracked_list)  # Update tracked list
@@ -586,8 +629,11 @@ class TrackedAnimeCard(FlippableCard):
         QMessageBox.information(self, "Success", f"Stopped tracking: {self.series_name}")
         
     def update_status(self):
-        status = self.check_series_status()
-        is_tracked = any(self.series_name in anime for anime in self.manager.tracked_anime)
+        self.set_status(self.check_series_status())
+        
+    def set_status(self, status):
+        """Show a series status on both faces of the card"""
+        is_tracked = self.manager.is_tracked(self.series_name)
         
         if status == "Ended":
             self.status_label.setText("Series Ended ✓")
@@ -603,41 +649,22 @@ class TrackedAnimeCard(FlippableCard):
             self.end_notice.hide()
             self.setProperty("ended", False)
         
+        if self.series_status_label is not None:
+            self.series_status_label.setText(f"Status: {status}")
+            self.series_status_label.setStyleSheet(
+                "color: #00b894; font-weight: bold;" if status == "Ongoing" else "color: #d63031; font-weight: bold;"
+            )
+        
         # Force style update
         self.style().unpolish(self)
         self.style().polish(self)
         
     def check_series_status(self):
-        try:
-            import requests
-            import time
-            
-            # Clean up title for search
-            search_title = self.series_name.replace("[SubsPlease]", "").strip()
-            
-            # Search for anime
-            response = requests.get(
-                f"https://api.jikan.moe/v4/anime",
-                params={"q": search_title, "limit": 1},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data["data"]:
-                    anime = data["data"][0]
-                    status = anime.get("status", "").lower()
-                    if "finished" in status or "completed" in status:
-                        return "Ended"
-            
-            return "Ongoing"
-            
-        except Exception:
-            return "Ongoing"  # Default to ongoing if check fails
+        return self.manager.get_series_status(self.series_name, fetch=False)
         
     def update_countdown(self):
         try:
-            schedule_data = self.manager.fetch_schedule()
+            schedule_data = self.manager.get_schedule()
             if not schedule_data:
                 self.countdown_label.setText("Schedule unavailable")
                 return
@@ -647,7 +674,7 @@ class TrackedAnimeCard(FlippableCard):
             
             for day, shows in schedule_data["schedule"].items():
                 for show in shows:
-                    if self.series_name in show['title']:
+                    if self.manager.find_tracked_series(show['title']) == self.series_name:
                         time_str = show['time']
                         anime_time = datetime.strptime(time_str, "%H:%M")
                         
@@ -696,6 +723,7 @@ class DownloadCard(FlippableCard):
     def __init__(self, filename, manager, parent=None):
         super().__init__()
         self.filename = filename
+        self.release = parse_release(filename)
         self.manager = manager
         self.original_pixmap = None
         self.setup_ui()
@@ -738,8 +766,7 @@ class DownloadCard(FlippableCard):
         self.back_widget.hide()
         
         # Load image
-        series_name = self.filename.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        self.loader = ImageLoader(series_name, self.manager)
+        self.loader = ImageLoader(self.release.series, self.manager)
         self.loader.image_loaded.connect(self.set_image)
         self.loader.start()
         
@@ -755,16 +782,14 @@ class DownloadCard(FlippableCard):
         layout.addWidget(self.image_label)
         
         # Series name
-        series_name = self.filename.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        name_label = QLabel(series_name)
+        name_label = QLabel(self.release.series)
         name_label.setWordWrap(True)
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         name_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(name_label)
         
         # Episode info
-        episode_info = self.filename.split(" - ")[-1].split("[")[0].strip()
-        episode_label = QLabel(f"Episode {episode_info}")
+        episode_label = QLabel(f"Episode {episode_text(self.release)}")
         episode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         episode_label.setStyleSheet("color: #666666;")
         layout.addWidget(episode_label)
@@ -847,8 +872,7 @@ class DownloadCard(FlippableCard):
         layout.addWidget(delete_btn)
         
     def set_image(self, title, pixmap):
-        series_name = self.filename.replace("[SubsPlease]", "").strip().split(" - ")[0]
-        if title == series_name:
+        if title == self.release.series:
             self.original_pixmap = pixmap
             scaled_pixmap = pixmap.scaled(
                 self.image_label.size(),
@@ -916,6 +940,11 @@ class DownloadCard(FlippableCard):
             self.progress_bar.hide()
 
 class MainWindow(QMainWindow):
+    feed_requested = pyqtSignal()
+    schedule_requested = pyqtSignal(bool)
+    series_status_changed = pyqtSignal(str, str)
+    torrent_submitted = pyqtSignal(str, str)
+    
     def __init__(self):
         super().__init__()
         print("Initializing ANICHAIN...")
@@ -923,8 +952,8 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("ANICHAIN")
         self.setMinimumSize(800, 600)
         
-        # Cache for series status
-        self.series_status_cache = {}
+        # Feed snapshot version currently shown in the grid
+        self.displayed_feed_version = None
         
         # Create central widget with layout
         central_widget = QWidget()
@@ -943,6 +972,12 @@ class MainWindow(QMainWindow):
         # Setup timers
         self.setup_timers()
         
+        # Feed and schedule fetches run on a background worker
+        self.setup_feed_worker()
+        
+        # Torrent queue results come back from its worker thread
+        self.torrent_submitted.connect(self.on_torrent_submitted)
+        
         # Initialize resize timer
         self.resize_timer = QTimer()
         self.resize_timer.setSingleShot(True)
@@ -966,25 +1001,59 @@ class MainWindow(QMainWindow):
             print("qBittorrent connected successfully")
             self.update_qbittorrent_status()
             
+    def setup_feed_worker(self):
+        """Move feed and schedule loading to a worker thread"""
+        self.feed_thread = QThread()
+        self.feed_worker = FeedWorker(self.manager)
+        self.feed_worker.moveToThread(self.feed_thread)
+        self.feed_requested.connect(self.feed_worker.load_feed)
+        self.schedule_requested.connect(self.feed_worker.load_schedule)
+        self.feed_worker.feed_loaded.connect(self.on_feed_loaded)
+        self.feed_worker.schedule_loaded.connect(self.on_schedule_loaded)
+        self.feed_worker.prefetch_progress.connect(self.on_prefetch_progress)
+        self.feed_thread.start()
+        
     def load_feed(self):
-        """Load RSS feed asynchronously"""
+        """Ask the worker to refresh the RSS feed"""
         print("Loading RSS feed...")
+        self.feed_requested.emit()
+        
+    def on_feed_loaded(self, snapshot):
+        """Render a feed snapshot delivered by the worker"""
         try:
-            self.manager.load_feed()
             print("RSS feed loaded successfully")
-            self.display_anime_tiles()
+            if snapshot.version != self.displayed_feed_version and not self.search_input.text():
+                self.display_anime_tiles()
         except Exception as e:
-            print(f"Error loading RSS feed: {str(e)}")
+            print(f"Error displaying RSS feed: {str(e)}")
+        
+        # Poll again sooner around tracked air times, back off otherwise
+        self.feed_timer.start(int(self.manager.next_poll_delay() * 1000))
             
     def load_schedule(self):
-        """Load schedule asynchronously"""
+        """Ask the worker to refresh the schedule"""
         print("Loading schedule...")
+        self.schedule_requested.emit(True)
+        
+    def on_prefetch_progress(self, progress):
+        """Show how far the metadata and artwork prefetch has got"""
+        if progress.finished:
+            self.prefetch_label.hide()
+            return
+        eta = progress.eta()
+        text = f"Loading artwork {progress.done}/{progress.total}"
+        if eta is not None:
+            text += f", about {int(eta) + 1}s left"
+        self.prefetch_label.setText(text)
+        self.prefetch_label.show()
+        
+    def on_schedule_loaded(self, schedule_data):
+        """Render a schedule delivered by the worker"""
         try:
-            self.manager.load_schedule()
             print("Schedule loaded successfully")
             self.display_schedule()
         except Exception as e:
-            print(f"Error loading schedule: {str(e)}")
+            print(f"Error displaying schedule: {str(e)}")
             
     def update_tracked_list(self):
         """Update tracked anime list asynchronously"""
@@ -1007,45 +1076,41 @@ class MainWindow(QMainWindow):
     def handle_resize_timeout(self):
         """Handle resize event after timer timeout"""
         try:
-            self.display_anime_tiles()
+            # Redraw from the in-memory snapshot, keeping any active search
+            self.perform_search()
         except Exception as e:
             print(f"Error handling resize: {str(e)}")
 
     def check_series_status(self, series_name):
-        """Check series status with caching"""
-        if series_name in self.series_status_cache:
-            return self.series_status_cache[series_name]
-            
-        try:
-            import requests
-            import time
-            
-            # Clean up title for search
-            search_title = series_name.replace("[SubsPlease]", "").strip()
-            
-            # Search for anime
-            response = requests.get(
-                f"https://api.jikan.moe/v4/anime",
-                params={"q": search_title, "limit": 1},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data["data"]:
-                    anime = data["data"][0]
-                    status = anime.get("status", "").lower()
-                    result = "Ended" if "finished" in status or "completed" in status else "Ongoing"
-                    self.series_status_cache[series_name] = result
-                    return result
-            
-            return "Ongoing"
-            
-        except Exception:
-            return "Ongoing"  # Default to ongoing if check fails
+        """Check series status in the shared metadata cache, without fetching"""
+        return self.manager.get_series_status(series_name, fetch=False)
+        
+    def refresh_series_statuses(self):
+        """Refresh stale statuses of the tracked page in the background"""
+        names = set(self.manager.tracked_anime)
+        for i in range(self.tracked_layout.count()):
+            card = self.tracked_layout.itemAt(i).widget()
+            if isinstance(card, TrackedAnimeCard):
+                names.add(card.series_name)
+        self.manager.refresh_series_statuses(names, self.series_status_changed.emit)
+        
+    def on_series_status_changed(self, series_name, status):
+        """Push a refreshed status to the tracked card of that series"""
+        for i in range(self.tracked_layout.count()):
+            card = self.tracked_layout.itemAt(i).widget()
+            if isinstance(card, TrackedAnimeCard) and card.series_name == series_name:
+                card.set_status(status)
             
-    def display_anime_tiles(self):
-        """Display anime tiles in the grid layout"""
+    def display_anime_tiles(self, entries=None):
+        """Display anime tiles from the feed snapshot (or the given entries)"""
+        if entries is None:
+            snapshot = self.manager.get_feed_snapshot()
+            entries = snapshot.entries
+            self.displayed_feed_version = snapshot.version
+        else:
+            # Filtered view, force a redraw on the next unfiltered display
+            self.displayed_feed_version = None
+        
         # Clear existing items
         for i in reversed(range(self.grid_layout.count())): 
             self.grid_layout.itemAt(i).widget().setParent(None)
@@ -1060,7 +1125,7 @@ class MainWindow(QMainWindow):
             columns = 3  # Small window
             
         # Add new items
-        for i, entry in enumerate(self.manager.fetch_rss_feed().entries):
+        for i, entry in enumerate(entries):
             card = AnimeCard(entry.get("title", "No Title"), self.manager)
             card.clicked.connect(self.on_anime_clicked)
             card.setFixedSize(220, 380)  # Fixed size for entire card
@@ -1100,15 +1165,21 @@ class MainWindow(QMainWindow):
         self.schedule_timer.timeout.connect(self.load_schedule)
         self.schedule_timer.start(300000)  # Every 5 minutes
         
+        # Series statuses; only those older than a day are fetched
+        self.series_status_changed.connect(self.on_series_status_changed)
+        self.status_timer = QTimer()
+        self.status_timer.timeout.connect(self.refresh_series_statuses)
+        self.status_timer.start(3600000)  # Every hour
+        
         # Update downloads more frequently to show progress
         self.downloads_timer = QTimer()
         self.downloads_timer.timeout.connect(self.update_downloads_list)
         self.downloads_timer.start(5000)  # Every 5 seconds
         
-        # Feed refresh timer
+        # Feed refresh timer, re-armed by load_feed from the poll scheduler
         self.feed_timer = QTimer()
+        self.feed_timer.setSingleShot(True)
         self.feed_timer.timeout.connect(self.load_feed)
-        self.feed_timer.start(300000)  # Every 5 minutes
         
     def show_qbittorrent_dialog(self):
         """Show the qBittorrent connection dialog"""
@@ -1157,15 +1228,14 @@ class MainWindow(QMainWindow):
         
         # Add from tracked anime
         for anime in self.manager.tracked_anime:
-            series_name = anime.replace("[SubsPlease]", "").strip().split(" - ")[0]
-            series_set.add(series_name)
+            series_set.add(parse_release(anime).series)
             
         # Add from downloaded files
         downloaded_files = self.manager.get_downloaded_files()
         for file in downloaded_files:
-            if file.endswith(".mkv"):
-                series_name = file.replace("[SubsPlease]", "").strip().split(" - ")[0]
-                series_set.add(series_name)
+            release = parse_release(file)
+            if release.extension == "mkv":
+                series_set.add(release.series)
         
         # Determine number of columns based on window width
         window_width = self.width()
@@ -1182,9 +1252,12 @@ class MainWindow(QMainWindow):
             card.setFixedSize(220, 380)  # Fixed size for entire card
             self.tracked_layout.addWidget(card, i // columns, i % columns)
             
+        # Cards show cached statuses; fetch the stale ones in the background
+        self.refresh_series_statuses()
+            
     def display_schedule(self):
         """Display schedule in the schedule text area"""
-        schedule_data = self.manager.fetch_schedule()
+        schedule_data = self.manager.get_schedule()
         if not schedule_data:
             self.schedule_text.setText("Failed to load schedule. Will retry in 5 minutes.")
             return
@@ -1237,8 +1310,8 @@ class MainWindow(QMainWindow):
                 time_str = show['time']
                 title = show['title']
                 
-                # Check if show is being tracked
-                is_tracked = any(title in anime for anime in self.manager.tracked_anime)
+                # Check if show is being tracked, also under another title
+                is_tracked = self.manager.find_tracked_series(title) is not None
                 
                 anime_time = datetime.strptime(time_str, "%H:%M")
                 anime_time = anime_time.replace(
@@ -1327,13 +1400,15 @@ class MainWindow(QMainWindow):
             self.folder_entry.setText(folder)
             
     def save_settings(self):
-        new_settings = {
+        # Start from the current settings so keys without a field (feed_sources) survive
+        new_settings = self.manager.settings.copy()
+        new_settings.update({
             "download_folder": self.folder_entry.text(),
             "rss_url": self.rss_entry.text(),
             "qb_host": self.qb_host_entry.text(),
             "qb_username": self.qb_username_entry.text(),
             "qb_password": self.qb_password_entry.text()
-        }
+        })
         
         try:
             self.manager.save_settings(new_settings)
@@ -1356,16 +1431,14 @@ class MainWindow(QMainWindow):
     def perform_search(self):
         search_term = self.search_input.text().lower()
         if not search_term:
-            self.load_feed()  # Reset to show all anime
+            self.display_anime_tiles()  # Reset to show all anime
             return
             
-        feed = self.manager.fetch_rss_feed()
-        if feed:
-            filtered_entries = [
-                entry for entry in feed.entries
-                if search_term in entry.get("title", "").lower()
-            ]
-            self.display_anime_tiles(filtered_entries)
+        filtered_entries = [
+            entry for entry in self.manager.get_feed_snapshot().entries
+            if search_term in entry.get("title", "").lower()
+        ]
+        self.display_anime_tiles(filtered_entries)
             
     def refresh_card_statuses(self):
         for i in range(self.grid_layout.count()):
@@ -1380,11 +1453,7 @@ class MainWindow(QMainWindow):
             if isinstance(widget, TrackedAnimeCard) and widget.isActiveWindow():
                 series_name = widget.series_name
                 # Remove all episodes of this series from tracked_anime
-                self.manager.tracked_anime = [
-                    anime for anime in self.manager.tracked_anime
-                    if series_name not in anime
-                ]
-                self.manager.save_tracked_anime(self.manager.tracked_anime)
+                self.manager.untrack_series(series_name)
                 self.update_tracked_list()
                 self.refresh_card_statuses()
                 return
@@ -1412,6 +1481,11 @@ class MainWindow(QMainWindow):
         self.status_text = QLabel()
         self.status_text.setStyleSheet("font-size: 12px;")
         
+        # Prefetch progress
+        self.prefetch_label = QLabel()
+        self.prefetch_label.setStyleSheet("font-size: 12px; color: #666666;")
+        self.prefetch_label.hide()
+        
         # Reconnect button
         self.reconnect_btn = QPushButton("Reconnect")
         self.reconnect_btn.setStyleSheet("""
@@ -1429,6 +1503,7 @@ class MainWindow(QMainWindow):
         self.reconnect_btn.clicked.connect(self.show_qbittorrent_dialog)
         self.reconnect_btn.hide()
         
+        status_layout.addWidget(self.prefetch_label)
         status_layout.addStretch()
         status_layout.addWidget(self.status_circle)
         status_layout.addWidget(self.status_text)
@@ -1440,18 +1515,14 @@ class MainWindow(QMainWindow):
     def on_anime_clicked(self, title):
         """Handle anime card click with optimized tracking"""
         # Extract series name
-        series_name = title.replace("[SubsPlease]", "").strip().split(" - ")[0]
+        series_name = parse_release(title).series
         
         # Check if already tracking
-        is_tracked = any(series_name in anime for anime in self.manager.tracked_anime)
+        is_tracked = self.manager.is_tracked(series_name)
         
         if is_tracked:
             # Just untrack series without deleting files
-            self.manager.tracked_anime = [
-                anime for anime in self.manager.tracked_anime
-                if series_name not in anime
-            ]
-            self.manager.save_tracked_anime(self.manager.tracked_anime)
+            self.manager.untrack_series(series_name)
             
             # Update UI safely
             QTimer.singleShot(0, lambda: self.update_tracked_list())
@@ -1460,34 +1531,45 @@ class MainWindow(QMainWindow):
             return
             
         # If not tracked, proceed with tracking and downloading
-        feed = self.manager.fetch_rss_feed()
-        if not feed:
-            QMessageBox.warning(self, "Error", "Could not fetch RSS feed")
+        entries = self.manager.get_feed_snapshot().entries
+        if not entries:
+            QMessageBox.warning(self, "Error", "RSS feed has not been loaded yet")
             return
             
-        for entry in feed.entries:
+        for entry in entries:
             if entry.get("title") == title:
                 if not self.manager.qb_client:
                     if not self.ensure_qbittorrent_connection():
                         QMessageBox.critical(self, "Error", "Not connected to qBittorrent")
                         return
                 
-                # Add torrent with category
-                if self.manager.add_torrent(entry.get("link"), category="Anime"):
-                    self.manager.tracked_anime.append(series_name)
-                    self.manager.save_tracked_anime(self.manager.tracked_anime)
-                    
-                    # Update UI safely using timers
-                    QTimer.singleShot(0, lambda: self.update_tracked_list())
-                    QTimer.singleShot(100, lambda: self.refresh_card_statuses())
-                    QMessageBox.information(self, "Success", 
-                        f"Started downloading: {title}\nTracking series: {series_name}")
-                else:
-                    QMessageBox.warning(self, "Error", 
-                        f"Failed to start download for: {title}")
+                # Add torrent with category; the result arrives through torrent_submitted
+                future = self.manager.submit_entries([entry], category="Anime")
+                future.add_done_callback(lambda f: self.torrent_submitted.emit(title, f.result()[0]))
                 return
                 
         QMessageBox.warning(self, "Error", f"Could not find torrent link for: {title}")
+        
+    def on_torrent_submitted(self, title, result):
+        """Track the series of a clicked release once qBittorrent answered"""
+        series_name = parse_release(title).series
+        if result in (TORRENT_ADDED, TORRENT_DUPLICATE):
+            self.manager.track_series(series_name)
+            if result == TORRENT_ADDED:
+                self.manager.mark_episode_grabbed(title)
+            
+            # Update UI safely using timers
+            QTimer.singleShot(0, lambda: self.update_tracked_list())
+            QTimer.singleShot(100, lambda: self.refresh_card_statuses())
+            if result == TORRENT_ADDED:
+                message = f"Started downloading: {title}"
+            else:
+                message = f"Already downloaded or queued: {title}"
+            QMessageBox.information(self, "Success", 
+                f"{message}\nTracking series: {series_name}")
+        else:
+            QMessageBox.warning(self, "Error", 
+                f"Failed to start download for: {title}")
 
     def setup_ui(self):
         """Setup the main UI components"""
@@ -1820,10 +1902,22 @@ class MainWindow(QMainWindow):
         """)
         settings_layout.addWidget(save_button, alignment=Qt.AlignmentFlag.AlignRight)
         
+        # Forget remembered "not found" lookups so covers and info are searched again
+        retry_lookups_button = QPushButton("Retry Missing Artwork")
+        retry_lookups_button.clicked.connect(self.retry_missing_lookups)
+        settings_layout.addWidget(retry_lookups_button, alignment=Qt.AlignmentFlag.AlignRight)
+        
         layout.addWidget(settings_frame)
         layout.addStretch()
         self.content_stack.addWidget(settings_page)
 
+    def retry_missing_lookups(self):
+        """Clear the negative lookup cache and redraw the covers"""
+        count = self.manager.invalidate_lookup_misses()
+        QMessageBox.information(self, "Retry Missing Artwork",
+            f"Cleared {count} failed lookups. They will be retried on the next refresh.")
+        self.perform_search()
+
     def show_qbittorrent_dialog(self):
         """Show the qBittorrent connection dialog"""
         dialog = QBittorrentDialog(self.manager, self)
@@ -1914,6 +2008,16 @@ class MainWindow(QMainWindow):
         self.downloads_timer.stop()
         self.feed_timer.stop()
         
+        # Cut the worker's HTTP retries short, then wait for it to stop. The
+        # wait is unbounded: destroying a running QThread aborts the app, and
+        # a request in progress still ends within its read timeout.
+        self.manager.http.close()
+        self.feed_thread.quit()
+        self.feed_thread.wait()
+        
+        # Close pooled connections and stop the network loop
+        self.manager.engine.close()
+        
         # Accept the close event
         event.accept()
 
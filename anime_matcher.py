@@ -0,0 +1,180 @@
+import re
+from collections import deque
+from functools import lru_cache
+from anime_parser import parse_release
+
+# Structural separators in release titles: " - ", brackets and parentheses
+SEPARATOR_PATTERN = re.compile(r"\s+-\s+|[\[\]\(\)]")
+NON_WORD_PATTERN = re.compile(r"[^0-9a-z|]+")
+SEGMENT = "|"
+MATCH_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=8192)
+def normalize_series(text):
+    """Normalized matching key for a series name or title.
+
+    Case and punctuation are dropped and structural separators become ``|``,
+    so "Shangri-La Frontier" and "shangri la frontier" share a key while
+    "Grisaia - Phantom Trigger" keeps its two segments.
+    """
+    text = SEPARATOR_PATTERN.sub(f" {SEGMENT} ", text.lower())
+    text = NON_WORD_PATTERN.sub(" ", text)
+    segments = [segment.strip() for segment in text.split(SEGMENT)]
+    return f" {SEGMENT} ".join(segment for segment in segments if segment)
+
+
+class SeriesMatcher:
+    """Index of tracked series names.
+
+    A title is first resolved to its parsed series and looked up by
+    normalized key. Only if that misses, an Aho-Corasick automaton over all
+    keys scans the normalized title for titles the parser could not split.
+    A key is accepted only where it covers whole segments and is followed by
+    the end of the title or a segment starting with a digit (episode,
+    resolution), so "Blue Lock" matches "Blue Lock - 01 [1080p]" but neither
+    "Blue Lock 2 - 01" nor a sequel subtitle as in "Grisaia - Phantom Trigger".
+
+    Adding a name extends the trie in place; failure links are recomputed
+    lazily on the next scan. Match results are cached per title until the
+    index changes.
+    """
+    def __init__(self, names=()):
+        self.names = {}          # tracked name -> key
+        self.keys = {}           # key -> set of tracked names
+        self.goto = [{}]
+        self.fail = [0]
+        self.terminal = [None]
+        self.output_link = [0]
+        self.dirty = False
+        self.match_cache = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    @staticmethod
+    def key_for(name):
+        return normalize_series(parse_release(name).series)
+
+    def add(self, name):
+        if name in self.names:
+            return
+        key = self.key_for(name)
+        if not key:
+            return
+        self.names[name] = key
+        if key in self.keys:
+            self.keys[key].add(name)
+            self.match_cache.clear()
+            return
+        self.keys[key] = {name}
+
+        node = 0
+        for char in key:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.terminal.append(None)
+                self.output_link.append(0)
+                self.goto[node][char] = next_node
+            node = next_node
+        self.terminal[node] = key
+        self.dirty = True
+        self.match_cache.clear()
+
+    def remove(self, name):
+        key = self.names.pop(name, None)
+        if key is None:
+            return
+        names = self.keys[key]
+        names.discard(name)
+        if names:
+            self.match_cache.clear()
+            return
+        del self.keys[key]
+
+        node = 0
+        for char in key:
+            node = self.goto[node][char]
+        self.terminal[node] = None
+        self.dirty = True
+        self.match_cache.clear()
+
+    def update(self, names):
+        """Make the index hold exactly `names`, touching only the difference."""
+        names = set(names)
+        for name in list(self.names):
+            if name not in names:
+                self.remove(name)
+        for name in names:
+            self.add(name)
+
+    def _build_links(self):
+        queue = deque()
+        for node in self.goto[0].values():
+            self.fail[node] = 0
+            self.output_link[node] = 0
+            queue.append(node)
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                fallback = self.goto[state].get(char, 0)
+                self.fail[child] = fallback if fallback != child else 0
+                link = self.fail[child]
+                self.output_link[child] = link if self.terminal[link] is not None else self.output_link[link]
+        self.dirty = False
+
+    def scan(self, text):
+        """Yield every key found in `text` on whole segments, followed by the end or a number."""
+        if self.dirty:
+            self._build_links()
+        normalized = normalize_series(text)
+        padded_length = len(normalized)
+        goto, fail, terminal, output_link = self.goto, self.fail, self.terminal, self.output_link
+        node = 0
+        for index, char in enumerate(normalized):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            match = node if terminal[node] is not None else output_link[node]
+            while match:
+                key = terminal[match]
+                start = index - len(key) + 1
+                end = index + 1
+                if ((start == 0 or normalized[start - 2:start] == f"{SEGMENT} ")
+                        and (end == padded_length or (normalized[end:end + 3] == f" {SEGMENT} "
+                                                      and normalized[end + 3:end + 4].isdigit()))):
+                    yield key
+                match = output_link[match]
+
+    def match(self, title):
+        """Return a tracked name matching `title`, or None."""
+        if title in self.match_cache:
+            return self.match_cache[title]
+        result = None
+        names = self.keys.get(self.key_for(title))
+        if names:
+            result = next(iter(names))
+        else:
+            for key in self.scan(title):
+                result = next(iter(self.keys[key]))
+                break
+        if len(self.match_cache) >= MATCH_CACHE_SIZE:
+            self.match_cache.clear()
+        self.match_cache[title] = result
+        return result
+
+    def exact_names(self, title):
+        """Return the tracked names with exactly the key of `title`."""
+        return set(self.keys.get(self.key_for(title), ()))
@@ -0,0 +1,152 @@
+import re
+from functools import lru_cache
+
+RELEASE_PATTERN = re.compile(r"""
+    ^\s*
+    (?:\[(?P<group>[^\]]+)\]\s*)?
+    (?P<series>.+?)
+    (?:
+        \s+-\s+(?P<episode>\d+(?:\.\d+)?)
+        (?:-(?P<episode_end>\d+(?:\.\d+)?))?
+        (?:v(?P<version>\d+))?
+    )?
+    \s*$
+""", re.VERBOSE)
+EXTENSION_PATTERN = re.compile(r"\.(?P<extension>mkv|mp4|avi|webm|torrent)\s*$")
+# One trailing "[...]" or "(...)" tag
+TAG_PATTERN = re.compile(r"\s*[\(\[](?P<tag>[^\(\)\[\]]*)[\)\]]\s*$")
+RESOLUTION_PATTERN = re.compile(r"\b(?:(?P<height>\d{3,4})p|\d{3,4}x(?P<size_height>\d{3,4}))\b", re.IGNORECASE)
+CRC32_PATTERN = re.compile(r"^[0-9A-Fa-f]{8}$")
+RANGE_PATTERN = re.compile(r"^(?P<start>\d+(?:\.\d+)?)-(?P<end>\d+(?:\.\d+)?)$")
+
+SEASON_PATTERN = re.compile(
+    r"(?:\bS(?P<short>\d+)|\bSeason\s+(?P<long>\d+)|\b(?P<ordinal>\d+)(?:st|nd|rd|th)\s+Season)$",
+    re.IGNORECASE
+)
+
+
+class Release:
+    """A parsed release title such as
+    ``[SubsPlease] Tower of God S2 - 26v2 (1080p) [011FFF36].mkv``.
+
+    `episode` and `episode_end` are kept as strings to preserve zero padding;
+    `episode_end` is only set for ranges and batches.
+    """
+    __slots__ = ("title", "group", "series", "season", "episode", "episode_end",
+                 "version", "resolution", "crc32", "extension", "is_batch")
+
+    def __init__(self, title, group=None, series="", season=None, episode=None,
+                 episode_end=None, version=None, resolution=None, crc32=None,
+                 extension=None, is_batch=False):
+        self.title = title
+        self.group = group
+        self.series = series
+        self.season = season
+        self.episode = episode
+        self.episode_end = episode_end
+        self.version = version
+        self.resolution = resolution
+        self.crc32 = crc32
+        self.extension = extension
+        self.is_batch = is_batch
+
+    @property
+    def episode_number(self):
+        """The (first) episode as a float, or None for movies and specials."""
+        return float(self.episode) if self.episode is not None else None
+
+    @property
+    def episode_label(self):
+        """Human readable episode, e.g. ``07``, ``01-12`` or ``03v2``."""
+        if self.episode is None:
+            return ""
+        label = self.episode
+        if self.episode_end is not None:
+            label += f"-{self.episode_end}"
+        if self.version is not None:
+            label += f"v{self.version}"
+        return label
+
+    def __repr__(self):
+        return (f"Release(series={self.series!r}, season={self.season!r}, "
+                f"episode={self.episode_label!r}, resolution={self.resolution!r}, "
+                f"group={self.group!r})")
+
+
+@lru_cache(maxsize=8192)
+def parse_release(title):
+    """Parse a release title or file name into a Release.
+
+    Results are memoized, so repeated calls for the same title (every grid
+    refresh, every card) are a dictionary lookup. Any number of trailing
+    "[...]"/"(...)" tags is stripped; resolution, CRC32, episode range and
+    Batch tags are recognized and the rest ("Multiple Subtitle", "HEVC") is
+    ignored. Titles that do not look like releases keep the whole stripped
+    string as the series name.
+    """
+    text = title or ""
+    extension_match = EXTENSION_PATTERN.search(text)
+    extension = None
+    if extension_match:
+        extension = extension_match.group("extension")
+        text = text[:extension_match.start()]
+
+    # Strip trailing tags in any number and order, keeping the ones we know
+    core = text
+    resolution = crc32 = batch_start = batch_end = None
+    is_batch = known_tag = False
+    while True:
+        tag_match = TAG_PATTERN.search(core)
+        if not tag_match or not core[:tag_match.start()].strip():
+            break
+        core = core[:tag_match.start()]
+        tag = tag_match.group("tag").strip()
+        resolution_match = RESOLUTION_PATTERN.search(tag)
+        range_match = RANGE_PATTERN.match(tag)
+        if resolution_match and resolution is None:
+            resolution = (resolution_match.group("height") or resolution_match.group("size_height")) + "p"
+        elif CRC32_PATTERN.match(tag):
+            crc32 = tag
+        elif tag.lower() == "batch":
+            is_batch = True
+        elif range_match:
+            batch_start, batch_end = range_match.group("start"), range_match.group("end")
+        else:
+            continue
+        known_tag = True
+
+    match = RELEASE_PATTERN.match(core)
+    if not match:
+        return Release(title or "", series=text.strip(), extension=extension)
+    if match.group("episode") is None and not known_tag:
+        # Not a release; parentheses are part of names such as "Dr. Stone (2019)"
+        match = RELEASE_PATTERN.match(text)
+
+    series = match.group("series").strip()
+    season_match = SEASON_PATTERN.search(series)
+    season = None
+    if season_match:
+        season = int(season_match.group("short") or season_match.group("long")
+                     or season_match.group("ordinal"))
+
+    episode = match.group("episode")
+    episode_end = match.group("episode_end")
+    if batch_start is not None:
+        episode = batch_start
+        episode_end = batch_end
+        is_batch = True
+
+    version = match.group("version")
+    return Release(
+        title,
+        group=match.group("group"),
+        series=series,
+        season=season,
+        episode=episode,
+        episode_end=episode_end,
+        version=int(version) if version else None,
+        resolution=resolution,
+        crc32=crc32.upper() if crc32 else None,
+        extension=extension,
+        is_batch=is_batch
+    )
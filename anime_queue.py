@@ -0,0 +1,155 @@
+import time
+import threading
+from concurrent.futures import Future
+
+SUBMIT_WINDOW = 0.5
+MAX_BATCH = 50
+MAX_SUBMIT_ATTEMPTS = 3
+RETRY_DELAY = 2
+VERIFY_DELAY = 1
+
+
+class TorrentSubmission:
+    __slots__ = ("link", "category", "infohash", "future", "attempts")
+
+    def __init__(self, link, category, infohash=None):
+        self.link = link
+        self.category = category
+        self.infohash = infohash
+        self.future = Future()
+        self.attempts = 0
+
+
+class TorrentQueue:
+    """Coalesce torrent submissions into as few qBittorrent requests as possible.
+
+    Links submitted within `window` seconds of each other are sent by a worker
+    thread as one `send(links, category)` call per category. Each submission
+    gets a Future that resolves to True once its link was accepted, or False
+    after `max_attempts` failed attempts.
+
+    `send` returns False when every link was rejected and raises when
+    qBittorrent could not be reached. A rejected batch is split in half and
+    each half resent, so one bad link does not fail the others; a batch that
+    raised is resent whole after an exponentially growing delay. Because
+    qBittorrent accepts a batch when any link in it was added, the optional
+    `verify(infohashes)` returns the infohashes qBittorrent really has, and
+    submissions with a known infohash missing from it are retried.
+    """
+    def __init__(self, send, verify=None, window=SUBMIT_WINDOW, max_batch=MAX_BATCH,
+                 max_attempts=MAX_SUBMIT_ATTEMPTS, retry_delay=RETRY_DELAY, verify_delay=VERIFY_DELAY):
+        self.send = send
+        self.verify = verify
+        self.retry_delay = retry_delay
+        self.verify_delay = verify_delay
+        self.window = window
+        self.max_batch = max_batch
+        self.max_attempts = max_attempts
+        self.pending = []
+        self.condition = threading.Condition()
+        self.worker = None
+        self.requests = 0
+
+    def submit(self, links, category=None, infohashes=None):
+        """Queue links (with their infohashes, if known) and return one Future per link, in order."""
+        infohashes = infohashes or [None] * len(links)
+        submissions = [TorrentSubmission(link, category, infohash) for link, infohash in zip(links, infohashes)]
+        with self.condition:
+            self.pending.extend(submissions)
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self._run, name="TorrentQueue", daemon=True)
+                self.worker.start()
+            self.condition.notify()
+        return [submission.future for submission in submissions]
+
+    def _take_batch(self):
+        with self.condition:
+            while not self.pending:
+                # Let the worker exit when idle; submit() starts a new one
+                if not self.condition.wait(timeout=30):
+                    if not self.pending:
+                        self.worker = None
+                        return None
+            deadline = time.monotonic() + self.window
+            while len(self.pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(timeout=remaining)
+            batch = self.pending[:self.max_batch]
+            del self.pending[:self.max_batch]
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            by_category = {}
+            for submission in batch:
+                by_category.setdefault(submission.category, []).append(submission)
+            for category, submissions in by_category.items():
+                self._send_batch(category, submissions)
+
+    def _send_batch(self, category, submissions):
+        for attempt in range(self.max_attempts):
+            self.requests += 1
+            try:
+                accepted = self.send([submission.link for submission in submissions], category)
+                break
+            except Exception as e:
+                if attempt == self.max_attempts - 1:
+                    print(f"Failed to submit torrents: {e}")
+                    for submission in submissions:
+                        submission.future.set_result(False)
+                    return
+                delay = self.retry_delay * 2 ** attempt
+                print(f"Failed to submit torrents ({e}), retrying in {delay}s")
+                time.sleep(delay)
+
+        if accepted:
+            self._verify_batch(submissions)
+            return
+
+        if len(submissions) > 1:
+            middle = len(submissions) // 2
+            self._send_batch(category, submissions[:middle])
+            self._send_batch(category, submissions[middle:])
+            return
+
+        self._retry(submissions[0])
+
+    def _verify_batch(self, submissions):
+        """Resolve an accepted batch, retrying links qBittorrent does not have."""
+        missing = {submission.infohash for submission in submissions if submission.infohash}
+        if self.verify and missing:
+            # Torrent files are fetched by qBittorrent in the background, so
+            # give links that are not listed yet a few chances to show up
+            for attempt in range(self.max_attempts):
+                if attempt:
+                    time.sleep(self.verify_delay)
+                try:
+                    missing -= self.verify(missing)
+                except Exception as e:
+                    print(f"Could not check added torrents: {e}")
+                    missing = set()
+                if not missing:
+                    break
+        else:
+            missing = set()
+
+        for submission in submissions:
+            if submission.infohash in missing:
+                self._retry(submission)
+            else:
+                submission.future.set_result(True)
+
+    def _retry(self, submission):
+        submission.attempts += 1
+        if submission.attempts >= self.max_attempts:
+            submission.future.set_result(False)
+            return
+        # Retry with the next batch
+        with self.condition:
+            self.pending.append(submission)
+            self.condition.notify()
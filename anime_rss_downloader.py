@@ -19,6 +19,7 @@ import os
 import json
 from datetime import datetime, timedelta
 import queue
+from anime_parser import parse_release
 
 SETTINGS_FILE = "settings.txt"
 TRACKED_FILE = "tracked_anime.txt"
@@ -52,10 +53,8 @@ def get_cached_image_path(title):
     return os.path.join(CACHE_DIR, f"{safe_title}.jpg")
 
 def fetch_anime_image(title):
-    # Clean up the title to get the actual anime name
-    clean_title = title.replace("[SubsPlease]", "").strip()
-    clean_title = clean_title.split(" - ")[0].strip()  # Get the part before the episode number
-    clean_title = clean_title.split("[")[0].strip()    # Remove any remaining brackets
+    # Get the actual anime name from the release title
+    clean_title = parse_release(title).series
 
     # Check cache first
     cache_path = get_cached_image_path(clean_title)
@@ -180,7 +179,8 @@ class AnimeCard(QFrame):
         layout.addWidget(self.image_label)
         
         # Title
-        clean_title = self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]
+        release = parse_release(self.title)
+        clean_title = release.series
         title_label = QLabel(clean_title)
         title_label.setWordWrap(True)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -188,7 +188,7 @@ class AnimeCard(QFrame):
         layout.addWidget(title_label)
         
         # Episode info
-        episode_info = self.title.split(" - ")[-1].split("[")[0].strip()
+        episode_info = f"{release.episode_label} ({release.resolution})" if release.resolution else release.episode_label
         episode_label = QLabel(episode_info)
         episode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         episode_label.setStyleSheet("color: #666666;")
@@ -200,7 +200,7 @@ class AnimeCard(QFrame):
         self.loader.start()
         
     def set_image(self, title, pixmap):
-        if title == self.title.replace("[SubsPlease]", "").strip().split(" - ")[0]:
+        if title == parse_release(self.title).series:
             self.image_label.setPixmap(pixmap)
             
     def mousePressEvent(self, event):
@@ -0,0 +1,133 @@
+import re
+from anime_parser import parse_release
+
+
+def compile_patterns(patterns):
+    """Combine regex strings into one case-insensitive alternation, or None.
+
+    Invalid patterns are reported and skipped.
+    """
+    valid = []
+    for pattern in patterns or ():
+        try:
+            re.compile(pattern)
+            valid.append(f"(?:{pattern})")
+        except re.error as e:
+            print(f"Ignoring invalid rule pattern {pattern!r}: {e}")
+    return re.compile("|".join(valid), re.IGNORECASE) if valid else None
+
+
+class DownloadRule:
+    """Download filters for one series, or for every series when `series` is None.
+
+    `resolutions` lists the accepted resolutions, most preferred first (empty
+    accepts any, preferring the highest). `min_episode` skips earlier
+    episodes and `allow_batches` controls whether batch releases are taken.
+    """
+    __slots__ = ("series", "include", "exclude", "resolutions", "min_episode", "allow_batches")
+
+    def __init__(self, series=None, include=(), exclude=(), resolutions=(), min_episode=None,
+                 allow_batches=True):
+        self.series = series
+        self.include = compile_patterns(include)
+        self.exclude = compile_patterns(exclude)
+        self.resolutions = {resolution.lower(): rank for rank, resolution in enumerate(reversed(resolutions))}
+        self.min_episode = float(min_episode) if min_episode is not None else None
+        self.allow_batches = allow_batches
+
+    @classmethod
+    def from_settings(cls, series, rule, defaults=None):
+        """Build a rule from its settings dict, falling back to `defaults`."""
+        def value(key, fallback):
+            if key in rule:
+                return rule[key]
+            return defaults.get(key, fallback) if defaults else fallback
+        return cls(
+            series,
+            include=value("include", ()),
+            exclude=value("exclude", ()),
+            resolutions=value("resolutions", ()),
+            min_episode=rule.get("min_episode"),
+            allow_batches=value("allow_batches", True)
+        )
+
+    def resolution_rank(self, resolution):
+        """Preference of a resolution, higher is better; None if not accepted."""
+        if not self.resolutions:
+            return int(resolution[:-1]) if resolution else 0
+        return self.resolutions.get((resolution or "").lower())
+
+    def accepts(self, title, release):
+        if self.exclude and self.exclude.search(title):
+            return False
+        if self.include and not self.include.search(title):
+            return False
+        if release.is_batch and not self.allow_batches:
+            return False
+        if self.min_episode is not None and release.episode is not None and \
+                release.episode_number < self.min_episode:
+            return False
+        return True
+
+
+class RuleEngine:
+    """Every download rule, compiled once and applied to a whole feed in one pass.
+
+    Global include/exclude patterns are merged into one regex each and checked
+    first; per-series rules are found by a dict lookup on the tracked name
+    that `match_series` returns. Of several releases of the same episode the
+    one with the preferred resolution and then the highest version wins.
+    """
+    def __init__(self, settings=None, tracked_records=()):
+        settings = settings or {}
+        self.include = compile_patterns(settings.get("include"))
+        self.exclude = compile_patterns(settings.get("exclude"))
+        defaults = {key: value for key, value in settings.items() if key not in ("include", "exclude", "series")}
+        self.default = DownloadRule.from_settings(None, defaults)
+        series_rules = settings.get("series", {})
+        self.series_rules = {}
+        for record in tracked_records:
+            rule = dict(series_rules.get(record["name"], {}))
+            if record.get("resolution") and "resolutions" not in rule:
+                rule["resolutions"] = [record["resolution"]]
+            if rule:
+                self.series_rules[record["name"]] = DownloadRule.from_settings(record["name"], rule, defaults)
+
+    def __len__(self):
+        return len(self.series_rules) + 1
+
+    def evaluate(self, entries, match_series):
+        """Return the entries that should be downloaded, in feed order.
+
+        `match_series` maps a title to its tracked series name, or None for
+        untracked titles.
+        """
+        best = {}
+        order = []
+        include, exclude = self.include, self.exclude
+        for entry in entries:
+            title = entry.get("title", "")
+            if exclude and exclude.search(title):
+                continue
+            if include and not include.search(title):
+                continue
+            name = match_series(title)
+            if name is None:
+                continue
+            release = parse_release(title)
+            rule = self.series_rules.get(name, self.default)
+            if not rule.accepts(title, release):
+                continue
+            resolution_rank = rule.resolution_rank(release.resolution)
+            if resolution_rank is None:
+                continue
+
+            key = (name, release.episode, release.episode_end, release.is_batch)
+            rank = (resolution_rank, int(release.version or 1))
+            current = best.get(key)
+            if current is None:
+                order.append(key)
+            elif current[0] >= rank:
+                continue
+            best[key] = (rank, entry)
+        return [best[key][1] for key in order]
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+FAST_POLL_INTERVAL = 10
+RELEASE_WINDOW = 30 * 60
+MIN_POLL_INTERVAL = 60
+MAX_POLL_INTERVAL = 30 * 60
+
+
+def get_air_times(schedule_data, match_series, now):
+    """Return (tracked name, last_air, next_air) for every tracked show in a schedule.
+
+    `schedule_data` is the SubsPlease schedule (fetched with tz=UTC),
+    `match_series` maps a schedule title to its tracked name (None if it is
+    not tracked) and `now` is a naive UTC datetime.
+    """
+    air_times = []
+    if not schedule_data:
+        return air_times
+    for day, shows in schedule_data.get("schedule", {}).items():
+        if day.lower() not in WEEKDAYS:
+            continue
+        day_index = WEEKDAYS.index(day.lower())
+        for show in shows:
+            name = match_series(show["title"])
+            if name is None:
+                continue
+            try:
+                hour, minute = (int(part) for part in show["time"].split(":"))
+            except (KeyError, ValueError):
+                continue
+            air = (now + timedelta(days=day_index - now.weekday())).replace(
+                hour=hour, minute=minute, second=0, microsecond=0
+            )
+            if air > now:
+                air -= timedelta(days=7)
+            air_times.append((name, air, air + timedelta(days=7)))
+    return air_times
+
+
+class PollScheduler:
+    """Decide how long to wait before the next feed poll.
+
+    Right after a tracked show's expected air time the feed is polled every
+    `fast_interval` seconds until an entry for that show shows up or the
+    release window passes. Otherwise the delay doubles after every poll that
+    brings nothing new, up to `max_interval`, but never sleeps past the next
+    expected release.
+    """
+    def __init__(self, fast_interval=FAST_POLL_INTERVAL, window=RELEASE_WINDOW,
+                 min_interval=MIN_POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL):
+        self.fast_interval = fast_interval
+        self.window = timedelta(seconds=window)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.idle_polls = 0
+        self.released = set()
+        self.polls = 0
+
+    def record_poll(self, new_series, air_times, now=None):
+        """Register a poll and the tracked names of the new entries it brought."""
+        now = now or datetime.utcnow()
+        self.polls += 1
+        if new_series:
+            self.idle_polls = 0
+        else:
+            self.idle_polls += 1
+        for name, last_air, _ in air_times:
+            if now - last_air <= self.window and name in new_series:
+                self.released.add((name, last_air))
+
+    def next_delay(self, air_times, now=None):
+        """Seconds to wait before the next poll."""
+        now = now or datetime.utcnow()
+        # Forget releases whose window has long passed
+        self.released = {key for key in self.released if now - key[1] <= self.window}
+
+        for name, last_air, _ in air_times:
+            if now - last_air <= self.window and (name, last_air) not in self.released:
+                return self.fast_interval
+
+        delay = min(self.min_interval * (2 ** min(self.idle_polls, 16)), self.max_interval)
+        upcoming = [(next_air - now).total_seconds() for _, _, next_air in air_times]
+        if upcoming:
+            delay = min(delay, max(min(upcoming), self.fast_interval))
+        return delay
@@ -0,0 +1,448 @@
+import json
+import time
+import sqlite3
+import threading
+
+
+class Database:
+    """One SQLite connection (WAL, synchronous=FULL) per database file.
+
+    Every store on the same file shares it through `open`, and all access
+    goes through `lock`, so the stores never contend for the file among
+    themselves. The connection is closed when the last store is closed.
+    """
+    instances = {}
+    instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.users = 0
+
+    @classmethod
+    def open(cls, path):
+        with cls.instances_lock:
+            database = cls.instances.get(path)
+            if database is None:
+                database = cls.instances[path] = cls(path)
+            database.users += 1
+            return database
+
+    def release(self):
+        with Database.instances_lock:
+            self.users -= 1
+            if self.users:
+                return
+            del Database.instances[self.path]
+        with self.lock:
+            self.conn.close()
+
+
+class Store:
+    """Base of the stores: creates `SCHEMA` on the shared connection of `path`."""
+    SCHEMA = ""
+
+    def __init__(self, path):
+        self.path = path
+        self.database = Database.open(path)
+        self.lock = self.database.lock
+        self.conn = self.database.conn
+        with self.lock:
+            self.conn.executescript(self.SCHEMA)
+            self.conn.commit()
+
+    def close(self):
+        self.database.release()
+
+
+class FeedHistory(Store):
+    """Embedded SQLite record of every feed entry that has been seen.
+
+    Entries are keyed by GUID, with the infohash indexed as a second identity so
+    the same release re-published under a new GUID is not reported as new.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feed_history (
+            guid TEXT PRIMARY KEY,
+            infohash TEXT,
+            title TEXT,
+            link TEXT,
+            series TEXT,
+            episode TEXT,
+            first_seen REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_infohash ON feed_history (infohash);
+        CREATE INDEX IF NOT EXISTS idx_history_series ON feed_history (series);
+        CREATE INDEX IF NOT EXISTS idx_history_first_seen ON feed_history (first_seen);
+    """
+
+    def record_entries(self, records):
+        """Store the given records and return the ones not seen before.
+
+        Each record is a dict with guid, infohash, title, link, series and
+        episode keys. The returned list keeps the input order.
+        """
+        return list(self.record_stream(records))
+
+    def record_stream(self, records, batch_size=500):
+        """Store records from any iterable, yielding each one not seen before.
+
+        Commits every `batch_size` records, so a large feed can be streamed
+        through without being held in memory.
+        """
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield from self._record_batch(batch)
+                batch = []
+        if batch:
+            yield from self._record_batch(batch)
+
+    def _record_batch(self, records):
+        new_records = []
+        now = time.time()
+        with self.lock:
+            for record in records:
+                infohash = record.get("infohash")
+                if infohash and self.conn.execute(
+                    "SELECT 1 FROM feed_history WHERE infohash = ? LIMIT 1", (infohash,)
+                ).fetchone():
+                    continue
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO feed_history "
+                    "(guid, infohash, title, link, series, episode, first_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (record["guid"], infohash, record.get("title"), record.get("link"),
+                     record.get("series"), record.get("episode"), now)
+                )
+                if cursor.rowcount == 1:
+                    new_records.append(record)
+            self.conn.commit()
+        return new_records
+
+    def has_seen(self, guid):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT 1 FROM feed_history WHERE guid = ? LIMIT 1", (guid,)
+            ).fetchone() is not None
+
+    def entries_since(self, timestamp):
+        """Return records first seen after `timestamp`, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT guid, infohash, title, link, series, episode, first_seen "
+                "FROM feed_history WHERE first_seen > ? ORDER BY first_seen",
+                (timestamp,)
+            ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def entries_for_series(self, series):
+        """Return every recorded entry of a series, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT guid, infohash, title, link, series, episode, first_seen "
+                "FROM feed_history WHERE series = ? ORDER BY first_seen",
+                (series,)
+            ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    @staticmethod
+    def _row_to_record(row):
+        guid, infohash, title, link, series, episode, first_seen = row
+        return {
+            "guid": guid,
+            "infohash": infohash,
+            "title": title,
+            "link": link,
+            "series": series,
+            "episode": episode,
+            "first_seen": first_seen
+        }
+
+
+class TrackedStore(Store):
+    """Tracked series, one row per normalized series key.
+
+    Every write is a single SQLite transaction with synchronous=FULL, so a
+    crash leaves either the old or the new record, never a torn file.
+    """
+    FIELDS = ("name", "mal_id", "resolution", "last_episode")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tracked_series (
+            key TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            mal_id INTEGER,
+            resolution TEXT,
+            last_episode TEXT,
+            added_at REAL
+        );
+    """
+
+    def upsert(self, key, name, **fields):
+        """Insert a series or update the given fields of an existing one."""
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown tracked series fields: {', '.join(sorted(unknown))}")
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO tracked_series (key, name, added_at) VALUES (?, ?, ?)",
+                (key, name, time.time())
+            )
+            if fields:
+                assignments = ", ".join(f"{field} = ?" for field in fields)
+                self.conn.execute(
+                    f"UPDATE tracked_series SET {assignments} WHERE key = ?",
+                    (*fields.values(), key)
+                )
+
+    def delete(self, key):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM tracked_series WHERE key = ?", (key,))
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT key, name, mal_id, resolution, last_episode, added_at "
+                "FROM tracked_series WHERE key = ?", (key,)
+            ).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def all(self):
+        """Return every tracked series, oldest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT key, name, mal_id, resolution, last_episode, added_at "
+                "FROM tracked_series ORDER BY added_at, name"
+            ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def import_series(self, series):
+        """Insert (key, name) pairs in one transaction, keeping existing rows."""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tracked_series (key, name, added_at) VALUES (?, ?, ?)",
+                [(key, name, now) for key, name in series]
+            )
+
+    @staticmethod
+    def _row_to_record(row):
+        key, name, mal_id, resolution, last_episode, added_at = row
+        return {
+            "key": key,
+            "name": name,
+            "mal_id": mal_id,
+            "resolution": resolution,
+            "last_episode": last_episode,
+            "added_at": added_at
+        }
+
+
+class DownloadGuard(Store):
+    """Persistent record of every release already sent to qBittorrent.
+
+    Releases are identified by infohash and by an episode key (series,
+    episode, resolution). Both sets are mirrored in memory so most duplicate
+    checks are a set lookup. A miss is checked against the table as well,
+    since another process (GUI and daemon) may have queued the release.
+    Releases still on their way to qBittorrent are held by `reserve` until
+    they are recorded or released.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS queued_downloads (
+            episode_key TEXT,
+            infohash TEXT,
+            title TEXT,
+            link TEXT,
+            queued_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_queued_episode ON queued_downloads (episode_key);
+        CREATE INDEX IF NOT EXISTS idx_queued_infohash ON queued_downloads (infohash);
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        with self.lock:
+            rows = self.conn.execute("SELECT episode_key, infohash FROM queued_downloads").fetchall()
+        self.episode_keys = {episode_key for episode_key, _ in rows if episode_key}
+        self.infohashes = {infohash for _, infohash in rows if infohash}
+        self.in_flight = set()
+        self.reserve_lock = threading.Lock()
+
+    def is_queued(self, infohash=None, episode_key=None):
+        if (infohash is not None and infohash in self.infohashes) or \
+                (episode_key is not None and episode_key in self.episode_keys):
+            return True
+        if infohash is None and episode_key is None:
+            return False
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT episode_key, infohash FROM queued_downloads WHERE episode_key = ? "
+                "UNION ALL SELECT episode_key, infohash FROM queued_downloads WHERE infohash = ? LIMIT 1",
+                (episode_key, infohash)
+            ).fetchone()
+            if row is None:
+                return False
+            if row[0]:
+                self.episode_keys.add(row[0])
+            if row[1]:
+                self.infohashes.add(row[1])
+        return True
+
+    def reserve(self, infohash=None, episode_key=None):
+        """Claim a release for submission; False if it is queued or already claimed."""
+        keys = [key for key in (infohash, episode_key) if key]
+        with self.reserve_lock:
+            if any(key in self.in_flight for key in keys) or self.is_queued(infohash, episode_key):
+                return False
+            self.in_flight.update(keys)
+            return True
+
+    def release(self, releases):
+        """Give up the claims of (episode_key, infohash, ...) releases that failed."""
+        with self.reserve_lock:
+            for episode_key, infohash, *_ in releases:
+                self.in_flight.discard(episode_key)
+                self.in_flight.discard(infohash)
+
+    def record(self, releases):
+        """Remember (episode_key, infohash, title, link) tuples as queued."""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO queued_downloads (episode_key, infohash, title, link, queued_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(*release, now) for release in releases]
+            )
+            for episode_key, infohash, _, _ in releases:
+                if episode_key:
+                    self.episode_keys.add(episode_key)
+                if infohash:
+                    self.infohashes.add(infohash)
+        self.release(releases)
+
+
+class SeriesAliases(Store):
+    """Alternative titles of a series, as reported by MyAnimeList/Jikan."""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS series_aliases (
+            name TEXT NOT NULL,
+            alias TEXT NOT NULL,
+            PRIMARY KEY (name, alias)
+        );
+    """
+
+    def add(self, name, aliases):
+        """Store aliases of `name`; returns how many were new."""
+        with self.lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO series_aliases (name, alias) VALUES (?, ?)",
+                [(name, alias) for alias in aliases if alias]
+            )
+            return self.conn.total_changes - before
+
+    def all(self):
+        """Return {name: [alias, ...]} for every series with aliases."""
+        with self.lock:
+            rows = self.conn.execute("SELECT name, alias FROM series_aliases ORDER BY name").fetchall()
+        aliases = {}
+        for name, alias in rows:
+            aliases.setdefault(name, []).append(alias)
+        return aliases
+
+
+class MetadataCache(Store):
+    """MyAnimeList metadata per normalized series key, as fetched from Jikan.
+
+    A record keeps the time it was fetched; callers decide per field how old
+    a value may be.
+    """
+    FIELDS = ("name", "mal_id", "title", "status", "synopsis", "image_url", "genres", "episodes")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS anime_metadata (
+            key TEXT PRIMARY KEY,
+            name TEXT,
+            mal_id INTEGER,
+            title TEXT,
+            status TEXT,
+            synopsis TEXT,
+            image_url TEXT,
+            genres TEXT,
+            episodes INTEGER,
+            fetched_at REAL
+        );
+    """
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(self.FIELDS)}, fetched_at FROM anime_metadata WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        record = dict(zip(self.FIELDS + ("fetched_at",), row))
+        record["key"] = key
+        record["genres"] = json.loads(record["genres"]) if record["genres"] else []
+        return record
+
+    def put(self, key, record):
+        """Store a record (a dict with FIELDS keys) fetched now."""
+        values = [record.get(field) for field in self.FIELDS]
+        values[self.FIELDS.index("genres")] = json.dumps(record.get("genres") or [])
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO anime_metadata (key, {', '.join(self.FIELDS)}, fetched_at) "
+                f"VALUES ({', '.join('?' * (len(self.FIELDS) + 2))})",
+                (key, *values, time.time())
+            )
+
+
+class MissCache(Store):
+    """Lookups that came back empty, so they are not repeated until they expire.
+
+    Keys are free-form strings such as "<series key>:metadata"; the series
+    key comes first so `invalidate` can drop a series' misses by prefix.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS lookup_misses (
+            key TEXT PRIMARY KEY,
+            missed_at REAL
+        );
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        with self.lock:
+            rows = self.conn.execute("SELECT key, missed_at FROM lookup_misses").fetchall()
+        self.misses = dict(rows)
+
+    def is_missing(self, key, ttl):
+        """Whether `key` missed less than `ttl` seconds ago."""
+        missed_at = self.misses.get(key)
+        return missed_at is not None and time.time() - missed_at < ttl
+
+    def add(self, key):
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO lookup_misses (key, missed_at) VALUES (?, ?)", (key, now))
+            self.misses[key] = now
+
+    def invalidate(self, prefix=""):
+        """Forget every miss whose key starts with `prefix` (all of them by default)."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM lookup_misses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+            count = 0
+            for key in [key for key in self.misses if key.startswith(prefix)]:
+                del self.misses[key]
+                count += 1
+            return count
+
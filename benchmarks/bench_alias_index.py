@@ -0,0 +1,73 @@
+"""Benchmark for anime_aliases.AliasIndex.
+
+Resolves 5,000 misspelled or re-seasoned titles against 1,500 known series
+with three aliases each.
+
+    python benchmarks/bench_alias_index.py
+"""
+import os
+import sys
+import random
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from anime_aliases import AliasIndex
+
+SYLLABLES = ("ka", "ki", "ku", "ke", "ko", "sa", "shi", "su", "se", "so", "ta", "chi", "tsu",
+             "te", "to", "na", "ni", "nu", "ne", "no", "ha", "hi", "fu", "he", "ho", "ma",
+             "mi", "mu", "me", "mo", "ya", "yu", "yo", "ra", "ri", "ru", "re", "ro", "wa", "n")
+
+
+def random_word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+
+
+def random_name(rng):
+    return " ".join(random_word(rng) for _ in range(rng.randint(2, 5))).title()
+
+
+def mangle(name, rng):
+    choice = rng.random()
+    if choice < 0.3:
+        return name + f" S{rng.randint(2, 3)}"
+    if choice < 0.6:
+        index = rng.randrange(len(name))
+        return name[:index] + name[index + 1:]
+    return name.lower()
+
+
+def main():
+    rng = random.Random(42)
+    series = {random_name(rng): [random_name(rng), random_name(rng)] for _ in range(1500)}
+    names = list(series)
+    titles = [mangle(rng.choice(names), rng) for _ in range(5000)]
+
+    def build():
+        index = AliasIndex()
+        for name, aliases in series.items():
+            index.add(name, aliases, source="metadata")
+        return index
+
+    index = build()
+
+    def cold():
+        index.lookup_cache.clear()
+        return [index.lookup(title) for title in titles]
+
+    def warm():
+        return [index.lookup(title) for title in titles]
+
+    build_time = min(timeit.repeat(build, number=1, repeat=3))
+    cold_time = min(timeit.repeat(cold, number=1, repeat=3))
+    warm_time = min(timeit.repeat(warm, number=1, repeat=3))
+    print(f"{len(index)} aliases, {len(titles)} lookups")
+    print(f"  index build: {build_time * 1000:8.2f} ms")
+    print(f"  cold lookup: {cold_time / len(titles) * 1e6:8.2f} us/title")
+    print(f"  warm lookup: {warm_time / len(titles) * 1e6:8.2f} us/title")
+    print(f"     resolved: {sum(match is not None for match in cold())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Micro-benchmark for anime_parser.parse_release.
+
+Builds a few thousand SubsPlease-style titles from the series names in
+image_cache/ and times the legacy string splitting against the compiled
+parser, both cold (cache cleared) and warm (memoized).
+
+    python benchmarks/bench_release_parser.py
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from anime_parser import parse_release
+
+
+def load_series_names():
+    names = []
+    for file in sorted(os.listdir(os.path.join(ROOT, "image_cache"))):
+        name = os.path.splitext(file)[0]
+        if not name.startswith("SubsPlease"):
+            names.append(name)
+    return names
+
+
+def build_titles(series_names):
+    titles = []
+    for series in series_names:
+        for episode in range(1, 41):
+            for resolution in ("480p", "720p", "1080p"):
+                crc = f"{(hash((series, episode, resolution)) & 0xFFFFFFFF):08X}"
+                version = "v2" if episode % 13 == 0 else ""
+                titles.append(f"[SubsPlease] {series} - {episode:02d}{version} ({resolution}) [{crc}].mkv")
+        titles.append(f"[SubsPlease] {series} (01-12) (1080p) [Batch]")
+    return titles
+
+
+def legacy_parse(title):
+    series = title.replace("[SubsPlease]", "").strip().split(" - ")[0]
+    episode = title.split(" - ")[-1].split("[")[0].strip()
+    return series, episode
+
+
+def main():
+    titles = build_titles(load_series_names())
+    repeat = 5
+    print(f"{len(titles)} titles, best of {repeat} runs")
+
+    legacy = min(timeit.repeat(lambda: [legacy_parse(t) for t in titles], number=1, repeat=repeat))
+
+    def cold():
+        parse_release.cache_clear()
+        for title in titles:
+            parse_release(title)
+
+    cold_time = min(timeit.repeat(cold, number=1, repeat=repeat))
+    warm_time = min(timeit.repeat(lambda: [parse_release(t) for t in titles], number=1, repeat=repeat))
+
+    for label, elapsed in (("legacy split", legacy), ("parser cold", cold_time), ("parser warm", warm_time)):
+        print(f"{label:>13}: {elapsed * 1000:8.2f} ms total, {elapsed / len(titles) * 1e6:6.2f} us/title")
+
+
+if __name__ == "__main__":
+    main()
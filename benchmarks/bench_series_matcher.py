@@ -0,0 +1,74 @@
+"""Benchmark for anime_matcher.SeriesMatcher.
+
+Matches 5,000 release titles against 500 tracked series, comparing the old
+linear substring scan with the indexed matcher (exact key lookup plus the
+Aho-Corasick fallback).
+
+    python benchmarks/bench_series_matcher.py
+"""
+import os
+import sys
+import random
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from anime_parser import parse_release
+from anime_matcher import SeriesMatcher, normalize_series
+
+WORDS = ("kimi", "no", "sekai", "saikyou", "isekai", "tensei", "maou", "yuusha", "koi",
+         "blue", "lock", "frontier", "shangri-la", "tower", "god", "karte", "ni", "wa",
+         "kamonohashi", "ron", "majo", "kizoku", "slime", "precure", "detective", "log")
+
+
+def build_series(count, rng):
+    names = set()
+    while len(names) < count:
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))).title()
+        if rng.random() < 0.2:
+            name += f" S{rng.randint(2, 4)}"
+        names.add(name)
+    return sorted(names)
+
+
+def main():
+    rng = random.Random(42)
+    all_series = build_series(1500, rng)
+    tracked = all_series[:500]
+    titles = [
+        f"[SubsPlease] {rng.choice(all_series)} - {rng.randint(1, 24):02d} (1080p) [{rng.getrandbits(32):08X}].mkv"
+        for _ in range(5000)
+    ]
+    print(f"{len(tracked)} tracked series x {len(titles)} titles")
+
+    def linear():
+        return [any(parse_release(title).series in anime for anime in tracked) for title in titles]
+
+    matcher = SeriesMatcher(tracked)
+
+    def indexed():
+        matcher.match_cache.clear()
+        normalize_series.cache_clear()
+        return [matcher.match(title) is not None for title in titles]
+
+    def indexed_warm():
+        return [matcher.match(title) is not None for title in titles]
+
+    # Warm the parser cache so both sides only pay for matching
+    indexed()
+    build = min(timeit.repeat(lambda: SeriesMatcher(tracked).scan("warm up"), number=1, repeat=3))
+    linear_time = min(timeit.repeat(linear, number=1, repeat=3))
+    indexed_time = min(timeit.repeat(indexed, number=1, repeat=3))
+    warm_time = min(timeit.repeat(indexed_warm, number=1, repeat=3))
+
+    print(f"  index build: {build * 1000:8.2f} ms")
+    print(f"linear substr: {linear_time * 1000:8.2f} ms")
+    print(f" indexed cold: {indexed_time * 1000:8.2f} ms")
+    print(f" indexed warm: {warm_time * 1000:8.2f} ms")
+    print(f"      matches: {sum(indexed())} indexed, {sum(linear())} linear "
+          f"(linear counts substring false positives)")
+
+
+if __name__ == "__main__":
+    main()